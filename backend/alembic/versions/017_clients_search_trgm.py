@@ -0,0 +1,42 @@
+"""Trigram indexes backing the client list search.
+
+list_clients filters with ILIKE '%term%' on full_name, cpf_cnpj and email.
+A leading wildcard cannot use a B-tree, so every search was a sequential scan
+of clients. GIN indexes with gin_trgm_ops (pg_trgm) let PostgreSQL answer those
+ILIKE predicates from the index.
+
+Revision ID: 017_clients_search_trgm
+Revises: 016_sicredi_event_webhook_id
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017_clients_search_trgm"
+down_revision = "016_sicredi_event_webhook_id"
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    "ix_clients_full_name_trgm": "full_name",
+    "ix_clients_cpf_cnpj_trgm": "cpf_cnpj",
+    "ix_clients_email_trgm": "email",
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in _INDEXES.items():
+        op.create_index(
+            name,
+            "clients",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name in _INDEXES:
+        op.drop_index(name, table_name="clients")
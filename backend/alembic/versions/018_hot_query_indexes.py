@@ -0,0 +1,52 @@
+"""Composite and partial indexes for the hot listing / dashboard queries.
+
+- invoices(client_lot_id, due_date): client_lot_id was not indexed at all,
+  yet every per-contract invoice lookup and selectin load filters on it.
+- invoices(company_id, due_date) partial on OVERDUE / PENDING: the dashboard
+  and financial aggregates only ever touch those statuses.
+- (company_id, created_at) on clients, lots and service_orders: the paginated
+  lists filter by tenant and order by created_at DESC.
+
+Revision ID: 018_hot_query_indexes
+Revises: 017_clients_search_trgm
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "018_hot_query_indexes"
+down_revision = "017_clients_search_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_invoices_client_lot_due", "invoices", ["client_lot_id", "due_date"])
+    op.create_index(
+        "ix_invoices_company_overdue",
+        "invoices",
+        ["company_id", "due_date"],
+        postgresql_where=sa.text("status = 'OVERDUE'"),
+    )
+    op.create_index(
+        "ix_invoices_company_pending",
+        "invoices",
+        ["company_id", "due_date"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index("ix_clients_company_created", "clients", ["company_id", "created_at"])
+    op.create_index("ix_lots_company_created", "lots", ["company_id", "created_at"])
+    op.create_index(
+        "ix_service_orders_company_created", "service_orders", ["company_id", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_service_orders_company_created", table_name="service_orders")
+    op.drop_index("ix_lots_company_created", table_name="lots")
+    op.drop_index("ix_clients_company_created", table_name="clients")
+    op.drop_index("ix_invoices_company_pending", table_name="invoices")
+    op.drop_index("ix_invoices_company_overdue", table_name="invoices")
+    op.drop_index("ix_invoices_client_lot_due", table_name="invoices")
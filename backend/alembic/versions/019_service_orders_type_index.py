@@ -0,0 +1,28 @@
+"""Index service_orders.service_type_id for the per-type analytics join.
+
+The services analytics endpoint joins service_orders to service_types and
+groups by type; the FK column had no index, so the join and the ON DELETE
+CASCADE from service_types both had to scan the whole table.
+
+Revision ID: 019_service_orders_type_index
+Revises: 018_hot_query_indexes
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "019_service_orders_type_index"
+down_revision = "018_hot_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_service_orders_service_type_id", "service_orders", ["service_type_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_service_orders_service_type_id", table_name="service_orders")
@@ -0,0 +1,33 @@
+"""Partial index for the open (PENDING / OVERDUE) invoices of a contract.
+
+The client portal summary counts each contract's PENDING and OVERDUE
+invoices and picks the next PENDING due date. Only open installments are
+ever read there, so a (client_lot_id, due_date) index restricted to those
+statuses stays small as paid installments accumulate.
+
+Revision ID: 020_invoices_open_by_contract_index
+Revises: 019_service_orders_type_index
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "020_invoices_open_by_contract_index"
+down_revision = "019_service_orders_type_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_invoices_client_lot_open_due",
+        "invoices",
+        ["client_lot_id", "due_date"],
+        postgresql_where=sa.text("status IN ('PENDING', 'OVERDUE')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_client_lot_open_due", table_name="invoices")
@@ -376,7 +376,7 @@ async def list_boletos_by_client(
     result = await db.execute(stmt)
     boletos = result.scalars().all()
     
-    return [BoletoListResponse.model_validate(b) for b in boletos]
+    return boletos
 
 
 # ---------------------------------------------------------------------------
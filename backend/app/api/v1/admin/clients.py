@@ -2,6 +2,7 @@ from typing import Optional
 
 """Admin client management endpoints."""
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from uuid import UUID
@@ -9,12 +10,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, UploadFile, File, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.audit import log_audit
 from app.core.database import get_db
-from app.core.deps import get_company_admin, require_permission
+from app.core.deps import get_company_admin, invalidate_profile_cache, require_permission
 from app.core.security import hash_password
 from app.models.client import Client
 from app.models.client_document import ClientDocument
@@ -29,7 +31,7 @@ from app.schemas.invoice import InvoiceResponse
 from app.schemas.lot import ClientLotResponse
 from app.services import client_service
 from app.services.email_service import send_credentials_email
-from app.services.storage_service import upload_file, get_public_url
+from app.services.storage_service import get_public_url, get_signed_urls, read_upload, upload_file
 from app.utils.exceptions import StorageError
 
 router = APIRouter(prefix="/clients", tags=["Admin Clients"])
@@ -172,7 +174,7 @@ async def get_client_lots(
             ClientLot.company_id == admin.company_id,
         )
     )
-    return [ClientLotResponse.model_validate(r) for r in rows.scalars().all()]
+    return rows.scalars().all()
 
 
 @router.get("/{client_id}/invoices", response_model=list[InvoiceResponse])
@@ -192,7 +194,7 @@ async def get_client_invoices(
         )
         .order_by(Invoice.due_date)
     )
-    return [InvoiceResponse.model_validate(r) for r in rows.scalars().all()]
+    return [InvoiceResponse.from_invoice(r) for r in rows.scalars().all()]
 
 
 @router.get("/{client_id}/documents", response_model=list[ClientDocumentResponse])
@@ -214,6 +216,7 @@ async def get_client_documents(
 
     rows = await db.execute(
         select(ClientDocument)
+        .options(lazyload("*"))
         .where(
             ClientDocument.client_id == client_id,
             ClientDocument.company_id == admin.company_id,
@@ -221,13 +224,13 @@ async def get_client_documents(
         .order_by(ClientDocument.created_at.desc())
     )
 
+    docs = rows.scalars().all()
+    # One signing request for the whole list instead of one per document.
+    urls = await get_signed_urls([d.file_path for d in docs if d.file_path])
     result: list[dict] = []
-    for doc in rows.scalars().all():
+    for doc in docs:
         payload = ClientDocumentResponse.model_validate(doc).model_dump()
-        try:
-            payload["file_url"] = get_public_url(doc.file_path)
-        except Exception:
-            payload["file_url"] = None
+        payload["file_url"] = urls.get(doc.file_path)
         result.append(payload)
     return result
 
@@ -277,7 +280,7 @@ async def upload_client_document(
     parsed_tags = parsed_tags[:20]
 
     try:
-        contents = await file.read()
+        contents = await read_upload(file)
         path = await upload_file(
             file_bytes=contents,
             original_filename=file.filename or "upload",
@@ -321,7 +324,7 @@ async def upload_client_document(
 
     payload = ClientDocumentResponse.model_validate(doc).model_dump()
     try:
-        payload["file_url"] = get_public_url(doc.file_path)
+        payload["file_url"] = await get_public_url(doc.file_path)
     except Exception:
         payload["file_url"] = None
     return payload
@@ -339,7 +342,7 @@ async def upload_client_photo(
     client = await client_service.get_client(db, admin.company_id, client_id)
 
     try:
-        contents = await file.read()
+        contents = await read_upload(file)
         path = await upload_file(
             file_bytes=contents,
             original_filename=file.filename or "photo",
@@ -365,7 +368,7 @@ async def upload_client_photo(
 
     payload = ClientResponse.model_validate(client).model_dump()
     try:
-        payload["photo_url"] = get_public_url(path)
+        payload["photo_url"] = await get_public_url(path)
     except Exception:
         pass
     return payload
@@ -420,7 +423,7 @@ async def create_portal_access(
         email=client.email,
         cpf_cnpj=client.cpf_cnpj,
         phone=client.phone,
-        hashed_password=hash_password(body.password),
+        hashed_password=await asyncio.to_thread(hash_password, body.password),
     )
     db.add(profile)
     try:
@@ -477,7 +480,7 @@ async def reset_portal_password(
         select(Profile).where(
             Profile.id == client.profile_id,
             Profile.company_id == admin.company_id,
-        )
+        ).execution_options(populate_existing=True)
     )
     profile = row.scalar_one_or_none()
     if not profile:
@@ -486,8 +489,9 @@ async def reset_portal_password(
             detail="Perfil vinculado não encontrado.",
         )
 
-    profile.hashed_password = hash_password(body.password)
+    profile.hashed_password = await asyncio.to_thread(hash_password, body.password)
     await db.flush()
+    invalidate_profile_cache(db, profile.id)
 
     await log_audit(
         db,
@@ -45,7 +45,7 @@ async def list_client_history(
         limit=limit,
         offset=offset,
     )
-    return [ContractHistoryResponse.model_validate(e) for e in entries]
+    return entries
 
 
 @router.post("", response_model=ContractHistoryResponse, status_code=status.HTTP_201_CREATED)
@@ -9,7 +9,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit import log_audit
@@ -232,14 +232,14 @@ async def approve_cycle(
     next_due = (last_inv.due_date + relativedelta(months=1)) if last_inv else datetime.now(timezone.utc).date() + relativedelta(months=1)
 
     # Count existing invoices for numbering
-    count_row = await db.execute(
-        select(Invoice)
+    existing_count = (await db.execute(
+        select(func.count())
+        .select_from(Invoice)
         .where(
             Invoice.client_lot_id == client_lot.id,
             Invoice.status != InvoiceStatus.CANCELLED,
         )
-    )
-    existing_count = len(list(count_row.scalars().all()))
+    )).scalar_one()
 
     total = client_lot.total_installments or 1
     invoices_to_generate = min(12, total - existing_count)
@@ -287,7 +287,6 @@ async def approve_cycle(
     )
 
     await db.commit()
-    await db.refresh(ap)
     logger.info("cycle_approved", approval_id=str(approval_id), cycle=ap.cycle_number)
     return CycleApprovalResponse.model_validate(ap)
 
@@ -327,6 +326,5 @@ async def reject_cycle(
     )
 
     await db.commit()
-    await db.refresh(ap)
     logger.info("cycle_rejected", approval_id=str(approval_id))
     return CycleApprovalResponse.model_validate(ap)
@@ -3,9 +3,10 @@
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select, extract, case
+from sqlalchemy import and_, func, select, extract, case, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -32,6 +33,7 @@ from app.schemas.dashboard import (
     RevenueChartPoint,
     ServiceChartPoint,
 )
+from app.utils.cache import TTLCache
 
 # Human-readable labels for audit entries, keyed by the audited table. Used to
 # turn the raw audit trail into friendly "recent activity" rows on the dashboard.
@@ -80,6 +82,13 @@ def _activity_description(entry: AuditLog) -> str:
 
 router = APIRouter(prefix="/dashboard", tags=["Admin Dashboard"])
 
+# Per-company aggregates for the dashboard cards. They scan whole tenant
+# tables, and the cards don't need second-level freshness, so each worker
+# reuses a result for a short while.
+DASHBOARD_CACHE_TTL_SECONDS = 30
+_stats_cache = TTLCache(maxsize=256, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+_financial_cache = TTLCache(maxsize=256, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+
 
 @router.get("/stats", response_model=AdminStats)
 async def get_stats(
@@ -88,93 +97,78 @@ async def get_stats(
 ):
     """General statistics for the admin dashboard."""
     cid = admin.company_id
+    stats = _stats_cache.get(cid)
+    if stats is None:
+        stats = await _compute_stats(db, cid)
+        _stats_cache.set(cid, stats)
+    return stats
 
-    total_clients = (await db.execute(
-        select(func.count()).where(Client.company_id == cid)
-    )).scalar() or 0
-
-    active_clients = (await db.execute(
-        select(func.count()).where(Client.company_id == cid, Client.status == ClientStatus.ACTIVE)
-    )).scalar() or 0
-
-    defaulter_clients = (await db.execute(
-        select(func.count()).where(Client.company_id == cid, Client.status == ClientStatus.DEFAULTER)
-    )).scalar() or 0
-
-    inactive_clients = (await db.execute(
-        select(func.count()).where(Client.company_id == cid, Client.status == ClientStatus.INACTIVE)
-    )).scalar() or 0
-
-    in_negotiation_clients = (await db.execute(
-        select(func.count()).where(Client.company_id == cid, Client.status == ClientStatus.IN_NEGOTIATION)
-    )).scalar() or 0
 
+async def _compute_stats(db: AsyncSession, cid: UUID) -> AdminStats:
+    """Aggregate the /stats counters for one company."""
     # New clients registered in the current calendar month.
     now = datetime.now(timezone.utc)
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    new_clients_this_month = (await db.execute(
-        select(func.count()).where(
-            Client.company_id == cid,
-            Client.created_at >= month_start,
-        )
-    )).scalar() or 0
+
+    # One single-row aggregate per table (COUNT ... FILTER), joined ON true
+    # so every counter comes back in a single round-trip.
+    clients_q = select(
+        func.count().label("total_clients"),
+        func.count().filter(Client.status == ClientStatus.ACTIVE).label("active_clients"),
+        func.count().filter(Client.status == ClientStatus.DEFAULTER).label("defaulter_clients"),
+        func.count().filter(Client.status == ClientStatus.INACTIVE).label("inactive_clients"),
+        func.count().filter(Client.status == ClientStatus.IN_NEGOTIATION).label("in_negotiation_clients"),
+        func.count().filter(Client.created_at >= month_start).label("new_clients_this_month"),
+    ).where(Client.company_id == cid).subquery()
 
     # Active contracts (client_lots currently ACTIVE).
-    active_contracts = (await db.execute(
-        select(func.count()).where(
-            ClientLot.company_id == cid,
-            ClientLot.status == ClientLotStatus.ACTIVE,
-        )
-    )).scalar() or 0
+    contracts_q = select(
+        func.count().label("active_contracts"),
+    ).where(
+        ClientLot.company_id == cid,
+        ClientLot.status == ClientLotStatus.ACTIVE,
+    ).subquery()
 
-    open_orders = (await db.execute(
-        select(func.count()).where(
-            ServiceOrder.company_id == cid,
+    orders_q = select(
+        func.count().filter(
             ServiceOrder.status.in_([
                 ServiceOrderStatus.REQUESTED,
                 ServiceOrderStatus.APPROVED,
                 ServiceOrderStatus.IN_PROGRESS,
-            ]),
+            ])
+        ).label("open_orders"),
+        func.count().filter(ServiceOrder.status == ServiceOrderStatus.COMPLETED).label("completed_orders"),
+    ).where(ServiceOrder.company_id == cid).subquery()
+
+    lots_q = select(
+        func.count().label("total_lots"),
+        func.count().filter(Lot.status == LotStatus.AVAILABLE).label("available_lots"),
+        func.count().filter(Lot.status == LotStatus.RESERVED).label("reserved_lots"),
+        func.count().filter(Lot.status == LotStatus.SOLD).label("sold_lots"),
+    ).where(Lot.company_id == cid).subquery()
+
+    counts = (await db.execute(
+        select(clients_q, contracts_q, orders_q, lots_q).select_from(
+            clients_q.join(contracts_q, true())
+            .join(orders_q, true())
+            .join(lots_q, true())
         )
-    )).scalar() or 0
-
-    completed_orders = (await db.execute(
-        select(func.count()).where(
-            ServiceOrder.company_id == cid,
-            ServiceOrder.status == ServiceOrderStatus.COMPLETED,
-        )
-    )).scalar() or 0
-
-    total_lots = (await db.execute(
-        select(func.count()).where(Lot.company_id == cid)
-    )).scalar() or 0
-
-    available_lots = (await db.execute(
-        select(func.count()).where(Lot.company_id == cid, Lot.status == LotStatus.AVAILABLE)
-    )).scalar() or 0
-
-    reserved_lots = (await db.execute(
-        select(func.count()).where(Lot.company_id == cid, Lot.status == LotStatus.RESERVED)
-    )).scalar() or 0
-
-    sold_lots = (await db.execute(
-        select(func.count()).where(Lot.company_id == cid, Lot.status == LotStatus.SOLD)
-    )).scalar() or 0
+    )).one()
 
     return AdminStats(
-        total_clients=total_clients,
-        active_clients=active_clients,
-        defaulter_clients=defaulter_clients,
-        inactive_clients=inactive_clients,
-        in_negotiation_clients=in_negotiation_clients,
-        new_clients_this_month=new_clients_this_month,
-        active_contracts=active_contracts,
-        open_service_orders=open_orders,
-        completed_service_orders=completed_orders,
-        total_lots=total_lots,
-        available_lots=available_lots,
-        reserved_lots=reserved_lots,
-        sold_lots=sold_lots,
+        total_clients=counts.total_clients,
+        active_clients=counts.active_clients,
+        defaulter_clients=counts.defaulter_clients,
+        inactive_clients=counts.inactive_clients,
+        in_negotiation_clients=counts.in_negotiation_clients,
+        new_clients_this_month=counts.new_clients_this_month,
+        active_contracts=counts.active_contracts,
+        open_service_orders=counts.open_orders,
+        completed_service_orders=counts.completed_orders,
+        total_lots=counts.total_lots,
+        available_lots=counts.available_lots,
+        reserved_lots=counts.reserved_lots,
+        sold_lots=counts.sold_lots,
     )
 
 
@@ -185,50 +179,44 @@ async def financial_overview(
 ):
     """Financial summary: receivable, received, overdue."""
     cid = admin.company_id
+    overview = _financial_cache.get(cid)
+    if overview is None:
+        overview = await _compute_financial_overview(db, cid)
+        _financial_cache.set(cid, overview)
+    return overview
 
-    total_receivable = (await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount), 0)).where(
-            Invoice.company_id == cid,
-            Invoice.status == InvoiceStatus.PENDING,
-        )
-    )).scalar()
-
-    total_received = (await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount), 0)).where(
-            Invoice.company_id == cid,
-            Invoice.status == InvoiceStatus.PAID,
-        )
-    )).scalar()
-
-    overdue_q = select(
-        func.coalesce(func.sum(Invoice.amount), 0),
-        func.count(),
-    ).where(
-        Invoice.company_id == cid,
-        Invoice.status == InvoiceStatus.OVERDUE,
-    )
-    row = (await db.execute(overdue_q)).one()
 
+async def _compute_financial_overview(db: AsyncSession, cid: UUID) -> FinancialOverview:
+    """Aggregate the /financial-overview totals for one company."""
     # Pending invoices coming due within the next 7 days (upcoming collections).
     today = datetime.now(timezone.utc).date()
-    due_soon_q = select(
-        func.coalesce(func.sum(Invoice.amount), 0),
-        func.count(),
-    ).where(
-        Invoice.company_id == cid,
-        Invoice.status == InvoiceStatus.PENDING,
+    pending = Invoice.status == InvoiceStatus.PENDING
+    overdue = Invoice.status == InvoiceStatus.OVERDUE
+    due_soon = and_(
+        pending,
         Invoice.due_date >= today,
         Invoice.due_date <= today + timedelta(days=7),
     )
-    due_soon = (await db.execute(due_soon_q)).one()
+
+    # Every total from a single pass over the company's invoices.
+    row = (await db.execute(
+        select(
+            func.coalesce(func.sum(Invoice.amount).filter(pending), 0).label("receivable"),
+            func.coalesce(func.sum(Invoice.amount).filter(Invoice.status == InvoiceStatus.PAID), 0).label("received"),
+            func.coalesce(func.sum(Invoice.amount).filter(overdue), 0).label("overdue_amount"),
+            func.count().filter(overdue).label("overdue_count"),
+            func.coalesce(func.sum(Invoice.amount).filter(due_soon), 0).label("due_soon_amount"),
+            func.count().filter(due_soon).label("due_soon_count"),
+        ).where(Invoice.company_id == cid)
+    )).one()
 
     return FinancialOverview(
-        total_receivable=Decimal(str(total_receivable)),
-        total_received=Decimal(str(total_received)),
-        total_overdue=Decimal(str(row[0])),
-        overdue_count=row[1],
-        due_soon_amount=Decimal(str(due_soon[0])),
-        due_soon_count=due_soon[1],
+        total_receivable=row.receivable,
+        total_received=row.received,
+        total_overdue=row.overdue_amount,
+        overdue_count=row.overdue_count,
+        due_soon_amount=row.due_soon_amount,
+        due_soon_count=row.due_soon_count,
     )
 
 
@@ -291,7 +279,7 @@ async def revenue_chart(
         .order_by("yr", "mo")
     )
     rows = (await db.execute(q)).all()
-    totals = {f"{int(r.yr)}-{int(r.mo):02d}": Decimal(str(r.total)) for r in rows}
+    totals = {f"{int(r.yr)}-{int(r.mo):02d}": r.total for r in rows}
 
     # Emit every month in the window so the chart has a continuous X axis.
     points: list[RevenueChartPoint] = []
@@ -365,7 +353,7 @@ async def list_defaulters(
             cpf_cnpj=r.cpf_cnpj,
             phone=r.phone,
             overdue_invoices=r.overdue_invoices,
-            overdue_amount=Decimal(str(r.overdue_amount)),
+            overdue_amount=r.overdue_amount,
             oldest_due_date=r.oldest_due_date,
             days_overdue=(today - r.oldest_due_date).days if r.oldest_due_date else 0,
         )
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.audit import log_audit
 from app.core.database import get_db
@@ -21,20 +22,31 @@ from app.schemas.client_document import (
     ClientDocumentUpdate,
     DocumentReviewRequest,
 )
-from app.services.storage_service import get_public_url
+from app.services.storage_service import get_public_url, get_signed_urls
 
 router = APIRouter(prefix="/documents", tags=["Admin Documents"])
 
 
-def _enrich(doc: ClientDocument) -> dict:
+async def _enrich(doc: ClientDocument) -> dict:
     resp = ClientDocumentResponse.model_validate(doc).model_dump()
     try:
-        resp["file_url"] = get_public_url(doc.file_path)
+        resp["file_url"] = await get_public_url(doc.file_path)
     except Exception:
         resp["file_url"] = None
     return resp
 
 
+async def _enrich_many(docs) -> list[dict]:
+    """Serialize a page of documents, signing every file URL in one request."""
+    urls = await get_signed_urls([d.file_path for d in docs if d.file_path])
+    out = []
+    for doc in docs:
+        resp = ClientDocumentResponse.model_validate(doc).model_dump()
+        resp["file_url"] = urls.get(doc.file_path)
+        out.append(resp)
+    return out
+
+
 @router.get("", response_model=list[ClientDocumentResponse])
 async def list_documents(
     client_id: Optional[UUID] = None,
@@ -47,7 +59,12 @@ async def list_documents(
     user: Profile = Depends(require_permission("view_documents")),
 ):
     """List all client documents for the company (with filters)."""
-    query = select(ClientDocument).where(ClientDocument.company_id == user.company_id)
+    # Flat response: skip the selectin client/reviewer cascade.
+    query = (
+        select(ClientDocument)
+        .options(lazyload("*"))
+        .where(ClientDocument.company_id == user.company_id)
+    )
 
     if client_id:
         query = query.where(ClientDocument.client_id == client_id)
@@ -64,7 +81,7 @@ async def list_documents(
     query = query.offset(offset).limit(per_page)
 
     rows = await db.execute(query)
-    return [_enrich(d) for d in rows.scalars().all()]
+    return await _enrich_many(rows.scalars().all())
 
 
 @router.get("/pending-count")
@@ -98,7 +115,7 @@ async def get_document(
     doc = row.scalar_one_or_none()
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
-    return _enrich(doc)
+    return await _enrich(doc)
 
 
 @router.get("/{document_id}/download")
@@ -118,7 +135,7 @@ async def download_document(
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     try:
-        url = get_public_url(doc.file_path)
+        url = await get_public_url(doc.file_path)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -168,7 +185,7 @@ async def update_document(
         changes.append(f"visible_to_client={body.visible_to_client}")
 
     if not changes:
-        return _enrich(doc)
+        return await _enrich(doc)
 
     await db.flush()
 
@@ -182,7 +199,7 @@ async def update_document(
         detail=", ".join(changes),
         ip_address=request.client.host if request.client else None,
     )
-    return _enrich(doc)
+    return await _enrich(doc)
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -272,4 +289,4 @@ async def review_document(
         ip_address=request.client.host if request.client else None,
     )
 
-    return _enrich(doc)
+    return await _enrich(doc)
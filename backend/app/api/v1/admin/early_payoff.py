@@ -44,7 +44,7 @@ async def list_requests(
 
     stmt = stmt.order_by(EarlyPayoffRequest.requested_at.desc()).limit(limit).offset(offset)
     result = await db.execute(stmt)
-    return [EarlyPayoffResponse.model_validate(r) for r in result.scalars().all()]
+    return result.scalars().all()
 
 
 @router.get("/{request_id}", response_model=EarlyPayoffResponse)
@@ -99,5 +99,4 @@ async def update_request(
     )
 
     await db.commit()
-    await db.refresh(req)
     return EarlyPayoffResponse.model_validate(req)
@@ -57,7 +57,7 @@ async def list_indices(
 
     stmt = stmt.order_by(EconomicIndex.reference_month.desc()).limit(limit).offset(offset)
     result = await db.execute(stmt)
-    return [EconomicIndexResponse.model_validate(r) for r in result.scalars().all()]
+    return result.scalars().all()
 
 
 @router.post("", response_model=EconomicIndexResponse, status_code=status.HTTP_201_CREATED)
@@ -112,7 +112,6 @@ async def create_index(
     )
 
     await db.commit()
-    await db.refresh(entry)
     logger.info("economic_index_created", index_id=str(entry.id))
     return EconomicIndexResponse.model_validate(entry)
 
@@ -152,7 +151,6 @@ async def update_index(
     )
 
     await db.commit()
-    await db.refresh(entry)
     return EconomicIndexResponse.model_validate(entry)
 
 
@@ -4,7 +4,6 @@ from typing import Optional
 
 import math
 from datetime import date, datetime, timezone
-from decimal import Decimal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
@@ -34,29 +33,20 @@ async def financial_summary(
     """Complete financial summary."""
     cid = admin.company_id
 
-    receivable = (await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount), 0)).where(
-            Invoice.company_id == cid, Invoice.status == InvoiceStatus.PENDING
-        )
-    )).scalar()
-
-    received = (await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount), 0)).where(
-            Invoice.company_id == cid, Invoice.status == InvoiceStatus.PAID
-        )
-    )).scalar()
-
-    overdue_sum, overdue_cnt = (await db.execute(
+    overdue = Invoice.status == InvoiceStatus.OVERDUE
+    receivable, received, overdue_sum, overdue_cnt = (await db.execute(
         select(
-            func.coalesce(func.sum(Invoice.amount), 0),
-            func.count(),
-        ).where(Invoice.company_id == cid, Invoice.status == InvoiceStatus.OVERDUE)
+            func.coalesce(func.sum(Invoice.amount).filter(Invoice.status == InvoiceStatus.PENDING), 0),
+            func.coalesce(func.sum(Invoice.amount).filter(Invoice.status == InvoiceStatus.PAID), 0),
+            func.coalesce(func.sum(Invoice.amount).filter(overdue), 0),
+            func.count().filter(overdue),
+        ).where(Invoice.company_id == cid)
     )).one()
 
     return FinancialOverview(
-        total_receivable=Decimal(str(receivable)),
-        total_received=Decimal(str(received)),
-        total_overdue=Decimal(str(overdue_sum)),
+        total_receivable=receivable,
+        total_received=received,
+        total_overdue=overdue_sum,
         overdue_count=overdue_cnt,
     )
 
@@ -79,7 +69,7 @@ async def receivables(
     rows = await db.execute(
         base.order_by(Invoice.due_date).offset((page - 1) * per_page).limit(per_page)
     )
-    items = [InvoiceResponse.model_validate(r) for r in rows.scalars().all()]
+    items = [InvoiceResponse.from_invoice(r) for r in rows.scalars().all()]
 
     return PaginatedResponse[InvoiceResponse](
         items=items, total=total, page=page, per_page=per_page,
@@ -124,7 +114,7 @@ async def defaulters(
                 client_id=row.id,
                 client_name=row.full_name,
                 overdue_months=months_overdue,
-                overdue_amount=Decimal(str(row.overdue_amount)),
+                overdue_amount=row.overdue_amount,
             )
         )
     return results
@@ -154,8 +144,8 @@ async def revenue_by_services(
         RevenueByService(
             service_type_id=r.id,
             service_name=r.name,
-            total_revenue=Decimal(str(r.total_revenue)),
-            total_cost=Decimal(str(r.total_cost)),
+            total_revenue=r.total_revenue,
+            total_cost=r.total_cost,
             order_count=r.order_count,
         )
         for r in rows
@@ -30,7 +30,13 @@ from app.services import client_lot_service
 from app.services.client_lot_service import get_remaining_installments, should_generate_next_batch
 from app.services.financial_defaults_service import get_all_effective_rates
 from app.services.pricing_service import compute_plan
-from app.services.storage_service import delete_file, enrich_photos, upload_file
+from app.services.storage_service import (
+    delete_file,
+    enrich_photo_lists,
+    enrich_photos,
+    read_upload,
+    upload_file,
+)
 from app.utils.exceptions import StorageError
 from app.utils.logging import get_logger
 from app.schemas.financial_settings import ClientLotFinancialUpdate, rate_to_percent
@@ -60,29 +66,39 @@ dev_router = APIRouter(prefix="/developments", tags=["Admin Developments"])
 ALLOWED_PHOTO_TYPES = {"image/jpeg", "image/png", "image/jpg", "image/webp", "image/gif"}
 MAX_PHOTO_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# List endpoints leave out the JSONB documents blob (only the detail GET
+# returns it); the serializers read rows by attribute, so they work unchanged.
+_DEV_LIST_COLUMNS = tuple(c for c in Development.__table__.c if c.key != "documents")
+_LOT_LIST_COLUMNS = tuple(c for c in Lot.__table__.c if c.key != "documents")
 
-def _dev_response(dev: Development) -> dict:
-    """Serialize a development, enriching photos with fresh signed URLs."""
+
+def _dev_payload(dev: Development, photos: list[dict]) -> dict:
     data = DevelopmentResponse.model_validate(dev).model_dump()
-    data["photos"] = enrich_photos(dev.photos or [])
+    data["photos"] = photos
     return data
 
 
-def _lot_response(lot: Lot) -> dict:
+async def _dev_response(dev: Development) -> dict:
+    """Serialize a development, enriching photos with fresh signed URLs."""
+    return _dev_payload(dev, await enrich_photos(dev.photos))
+
+
+async def _lot_response(lot: Lot) -> dict:
     """Serialize a lot, enriching photos with fresh signed URLs."""
     data = LotResponse.model_validate(lot).model_dump()
-    data["photos"] = enrich_photos(lot.photos or [])
+    data["photos"] = await enrich_photos(lot.photos)
     return data
 
 
-async def _add_photo(entity, *, company_id, subfolder: str, file: UploadFile,
+async def _add_photo(db: AsyncSession, entity, *, company_id, subfolder: str, file: UploadFile,
                      is_primary: bool, visible_to_client: bool, caption: Optional[str]) -> dict:
     """Upload a photo file and append it to the entity's JSONB photos list."""
     if file.content_type not in ALLOWED_PHOTO_TYPES:
         raise HTTPException(status_code=400, detail="Tipo de imagem não permitido (use JPG, PNG, WEBP ou GIF)")
-    contents = await file.read()
-    if len(contents) > MAX_PHOTO_SIZE:
-        raise HTTPException(status_code=400, detail=f"Imagem excede o tamanho máximo de {MAX_PHOTO_SIZE // (1024*1024)} MB")
+    try:
+        contents = await read_upload(file, MAX_PHOTO_SIZE)
+    except StorageError as exc:
+        raise HTTPException(status_code=400, detail=f"Imagem excede o tamanho máximo de {MAX_PHOTO_SIZE // (1024*1024)} MB") from exc
     try:
         path = await upload_file(
             file_bytes=contents,
@@ -93,6 +109,10 @@ async def _add_photo(entity, *, company_id, subfolder: str, file: UploadFile,
     except StorageError as exc:
         raise HTTPException(status_code=400, detail=exc.detail) from exc
 
+    # Re-read the gallery under a row lock only now that the upload is done,
+    # so two concurrent uploads can't each append to a stale copy and drop
+    # the other's photo (the lock is not held across the Storage call).
+    await db.refresh(entity, ["photos"], with_for_update=True)
     photos = list(entity.photos or [])
     # First photo of an entity becomes primary automatically.
     if is_primary or not photos:
@@ -132,7 +152,7 @@ def _update_photo(entity, photo_id: str, data: PhotoUpdate) -> None:
     flag_modified(entity, "photos")
 
 
-async def _delete_photo(entity, photo_id: str) -> None:
+async def _delete_photo(db: AsyncSession, entity, photo_id: str) -> None:
     """Remove a photo from the entity and delete its file from storage."""
     photos = list(entity.photos or [])
     target = next((p for p in photos if p.get("id") == photo_id), None)
@@ -144,6 +164,9 @@ async def _delete_photo(entity, photo_id: str) -> None:
         remaining[0]["is_primary"] = True
     entity.photos = remaining
     flag_modified(entity, "photos")
+    # Commit first so the gallery's row lock is released before the Storage
+    # round trip; a failed file delete only leaves an orphaned object.
+    await db.commit()
     if target.get("path"):
         try:
             await delete_file(target["path"])
@@ -181,9 +204,11 @@ async def list_developments(
     if max_price is not None:
         query = query.where(Development.price <= max_price)
 
-    query = query.order_by(Development.created_at.desc())
+    query = query.with_only_columns(*_DEV_LIST_COLUMNS).order_by(Development.created_at.desc())
     rows = await db.execute(query)
-    return [_dev_response(d) for d in rows.scalars().all()]
+    devs = rows.all()
+    galleries = await enrich_photo_lists([d.photos for d in devs])
+    return [_dev_payload(d, photos) for d, photos in zip(devs, galleries)]
 
 
 def _validate_development_data(data: DevelopmentCreate | DevelopmentUpdate, is_update: bool = False) -> None:
@@ -246,7 +271,7 @@ async def create_development(
     dev = Development(company_id=admin.company_id, **data.model_dump())
     db.add(dev)
     await db.flush()
-    return _dev_response(dev)
+    return await _dev_response(dev)
 
 
 @dev_router.get("/{dev_id}", response_model=DevelopmentResponse)
@@ -264,7 +289,7 @@ async def get_development(
     dev = result.scalar_one_or_none()
     if not dev:
         raise HTTPException(status_code=404, detail="Development not found")
-    return _dev_response(dev)
+    return await _dev_response(dev)
 
 
 @dev_router.put("/{dev_id}", response_model=DevelopmentResponse)
@@ -289,13 +314,19 @@ async def update_development(
     for k, v in data.model_dump(exclude_unset=True).items():
         setattr(dev, k, v)
     await db.flush()
-    return _dev_response(dev)
-
-
-async def _get_owned_development(db: AsyncSession, dev_id: UUID, company_id: UUID) -> Development:
-    dev = (await db.execute(
-        select(Development).where(Development.id == dev_id, Development.company_id == company_id)
-    )).scalar_one_or_none()
+    return await _dev_response(dev)
+
+
+async def _get_owned_development(
+    db: AsyncSession, dev_id: UUID, company_id: UUID, *, for_update: bool = False
+) -> Development:
+    """Load a tenant's development; ``for_update`` row-locks it for a
+    read-modify-write of its JSONB photos.  The photo handlers commit before
+    signing URLs, so the lock is never held across a Storage call."""
+    query = select(Development).where(Development.id == dev_id, Development.company_id == company_id)
+    if for_update:
+        query = query.with_for_update()
+    dev = (await db.execute(query)).scalar_one_or_none()
     if not dev:
         raise HTTPException(status_code=404, detail="Development not found")
     return dev
@@ -382,11 +413,11 @@ async def add_development_photo(
     """Upload a photo to a development gallery."""
     dev = await _get_owned_development(db, dev_id, admin.company_id)
     await _add_photo(
-        dev, company_id=admin.company_id, subfolder=f"developments/{dev_id}/photos",
+        db, dev, company_id=admin.company_id, subfolder=f"developments/{dev_id}/photos",
         file=file, is_primary=is_primary, visible_to_client=visible_to_client, caption=caption,
     )
-    await db.flush()
-    return _dev_response(dev)
+    await db.commit()
+    return await _dev_response(dev)
 
 
 @dev_router.patch("/{dev_id}/photos/{photo_id}", response_model=DevelopmentResponse)
@@ -398,10 +429,10 @@ async def update_development_photo(
     admin: Profile = Depends(require_permission("manage_lots")),
 ):
     """Toggle a development photo's primary flag / client visibility / caption."""
-    dev = await _get_owned_development(db, dev_id, admin.company_id)
+    dev = await _get_owned_development(db, dev_id, admin.company_id, for_update=True)
     _update_photo(dev, photo_id, data)
-    await db.flush()
-    return _dev_response(dev)
+    await db.commit()
+    return await _dev_response(dev)
 
 
 @dev_router.delete("/{dev_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -462,10 +493,9 @@ async def delete_development_photo(
     admin: Profile = Depends(require_permission("manage_lots")),
 ):
     """Remove a photo from a development gallery."""
-    dev = await _get_owned_development(db, dev_id, admin.company_id)
-    await _delete_photo(dev, photo_id)
-    await db.flush()
-    return _dev_response(dev)
+    dev = await _get_owned_development(db, dev_id, admin.company_id, for_update=True)
+    await _delete_photo(db, dev, photo_id)
+    return await _dev_response(dev)
 
 
 # ---------------------------------------------------------------------------
@@ -491,9 +521,17 @@ async def list_lots(
 
     total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
     rows = await db.execute(
-        base.order_by(Lot.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
+        base.with_only_columns(*_LOT_LIST_COLUMNS)
+        .order_by(Lot.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
     )
-    items = [_lot_response(r) for r in rows.scalars().all()]
+    # FastAPI validates the page against LotResponse once on the way out, so
+    # hand it plain row dicts instead of validating and dumping each row here.
+    page_rows = rows.all()
+    galleries = await enrich_photo_lists([r.photos for r in page_rows])
+    items = [
+        {**r._mapping, "photos": photos}
+        for r, photos in zip(page_rows, galleries)
+    ]
 
     return PaginatedResponse[LotResponse](
         items=items, total=total, page=page, per_page=per_page,
@@ -545,7 +583,7 @@ async def create_lot(
             status_code=409,
             detail=f"Já existe um lote cadastrado com a matrícula {data.registration_number}.",
         )
-    return _lot_response(lot)
+    return await _lot_response(lot)
 
 
 @router.get("/{lot_id}", response_model=LotResponse)
@@ -561,7 +599,7 @@ async def get_lot(
     lot = result.scalar_one_or_none()
     if not lot:
         raise HTTPException(status_code=404, detail="Lot not found")
-    return _lot_response(lot)
+    return await _lot_response(lot)
 
 
 @router.put("/{lot_id}", response_model=LotResponse)
@@ -585,13 +623,18 @@ async def update_lot(
             v = LotStatus(str(v).upper())
         setattr(lot, k, v)
     await db.flush()
-    return _lot_response(lot)
-
-
-async def _get_owned_lot(db: AsyncSession, lot_id: UUID, company_id: UUID) -> Lot:
-    lot = (await db.execute(
-        select(Lot).where(Lot.id == lot_id, Lot.company_id == company_id)
-    )).scalar_one_or_none()
+    return await _lot_response(lot)
+
+
+async def _get_owned_lot(
+    db: AsyncSession, lot_id: UUID, company_id: UUID, *, for_update: bool = False
+) -> Lot:
+    """Load a tenant's lot; ``for_update`` row-locks it for a read-modify-write
+    of its JSONB photos (released by the handler's commit, as for developments)."""
+    query = select(Lot).where(Lot.id == lot_id, Lot.company_id == company_id)
+    if for_update:
+        query = query.with_for_update()
+    lot = (await db.execute(query)).scalar_one_or_none()
     if not lot:
         raise HTTPException(status_code=404, detail="Lot not found")
     return lot
@@ -661,11 +704,11 @@ async def add_lot_photo(
     """Upload a photo to a lot gallery."""
     lot = await _get_owned_lot(db, lot_id, admin.company_id)
     await _add_photo(
-        lot, company_id=admin.company_id, subfolder=f"lots/{lot_id}/photos",
+        db, lot, company_id=admin.company_id, subfolder=f"lots/{lot_id}/photos",
         file=file, is_primary=is_primary, visible_to_client=visible_to_client, caption=caption,
     )
-    await db.flush()
-    return _lot_response(lot)
+    await db.commit()
+    return await _lot_response(lot)
 
 
 @router.patch("/{lot_id}/photos/{photo_id}", response_model=LotResponse)
@@ -677,10 +720,10 @@ async def update_lot_photo(
     admin: Profile = Depends(require_permission("manage_lots")),
 ):
     """Toggle a lot photo's primary flag / client visibility / caption."""
-    lot = await _get_owned_lot(db, lot_id, admin.company_id)
+    lot = await _get_owned_lot(db, lot_id, admin.company_id, for_update=True)
     _update_photo(lot, photo_id, data)
-    await db.flush()
-    return _lot_response(lot)
+    await db.commit()
+    return await _lot_response(lot)
 
 
 @router.delete("/{lot_id}/photos/{photo_id}", response_model=LotResponse)
@@ -691,10 +734,9 @@ async def delete_lot_photo(
     admin: Profile = Depends(require_permission("manage_lots")),
 ):
     """Remove a photo from a lot gallery."""
-    lot = await _get_owned_lot(db, lot_id, admin.company_id)
-    await _delete_photo(lot, photo_id)
-    await db.flush()
-    return _lot_response(lot)
+    lot = await _get_owned_lot(db, lot_id, admin.company_id, for_update=True)
+    await _delete_photo(db, lot, photo_id)
+    return await _lot_response(lot)
 
 
 @router.delete("/{lot_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -862,9 +904,8 @@ async def assign_lot(
     db.add(cl)
     await db.flush()
 
-    # Mark lot as sold
+    # Mark lot as sold; the UPDATE goes out with the next flush.
     lot.status = LotStatus.SOLD
-    await db.flush()
 
     # For a legacy client we intentionally skip invoice generation: the contract
     # is already running and its boletos will be issued on the next annual cycle.
@@ -886,6 +927,9 @@ async def assign_lot(
     first_due = date.fromisoformat(first_due_str) if first_due_str else data.purchase_date + timedelta(days=30)
     first_cycle_count = min(num_installments, 12)
 
+    # The first cycle's invoices go out in one flush, together with the lot's
+    # pending SOLD update.
+    invoices = []
     for i in range(first_cycle_count):
         # Use relativedelta so the day-of-month is preserved across months
         # (timedelta(days=30*i) drifts day 20 -> day 19 on 31-day months).
@@ -897,16 +941,16 @@ async def assign_lot(
             if installment_number == num_installments
             else installment_value
         )
-        invoice = Invoice(
+        invoices.append(Invoice(
             company_id=cid,
             client_lot_id=cl.id,
             due_date=due,
             amount=amount,
             installment_number=installment_number,
             status=InvoiceStatus.PENDING,
-        )
-        db.add(invoice)
+        ))
 
+    db.add_all(invoices)
     await db.flush()
 
     await log_audit(
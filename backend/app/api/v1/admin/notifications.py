@@ -41,7 +41,7 @@ async def list_notifications(
     query = query.order_by(Notification.created_at.desc()).offset(offset).limit(per_page)
 
     rows = await db.execute(query)
-    return [NotificationResponse.model_validate(n) for n in rows.scalars().all()]
+    return rows.scalars().all()
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
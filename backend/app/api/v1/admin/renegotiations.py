@@ -49,7 +49,7 @@ async def list_renegotiations(
 
     stmt = stmt.order_by(Renegotiation.created_at.desc()).limit(limit).offset(offset)
     result = await db.execute(stmt)
-    return [RenegotiationResponse.model_validate(r) for r in result.scalars().all()]
+    return result.scalars().all()
 
 
 @router.get("/debt-summary/{client_id}/{client_lot_id}")
@@ -2,7 +2,6 @@
 """Admin endpoints for monthly reports and accounting exports."""
 
 from datetime import date, datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
@@ -66,7 +65,7 @@ async def monthly_closure(
     )
     paid_row = paid_q.one()
     paid_count = paid_row.count
-    paid_total = Decimal(str(paid_row.total))
+    paid_total = paid_row.total
 
     # 2. Invoices generated this month
     generated_q = await db.execute(
@@ -91,7 +90,7 @@ async def monthly_closure(
     )
     overdue_row = overdue_q.one()
     overdue_count = overdue_row.count
-    overdue_total = Decimal(str(overdue_row.total))
+    overdue_total = overdue_row.total
 
     # 4. Defaulters (clients in DEFAULTER status)
     defaulter_count_q = await db.execute(
@@ -118,7 +117,7 @@ async def monthly_closure(
     )
     cancelled_row = cancelled_q.one()
     cancelled_count = cancelled_row.count
-    cancelled_total = Decimal(str(cancelled_row.total))
+    cancelled_total = cancelled_row.total
 
     # 6. Rescissions completed this month
     rescission_q = await db.execute(
@@ -187,7 +186,7 @@ async def monthly_closure(
         },
         "renegotiations": {
             "applied_count": renego_row.count,
-            "applied_total": float(Decimal(str(renego_row.total))),
+            "applied_total": float(renego_row.total),
         },
         "notifications_sent": notification_count,
     }
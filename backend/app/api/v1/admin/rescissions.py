@@ -50,7 +50,7 @@ async def list_rescissions(
 
     stmt = stmt.order_by(Rescission.created_at.desc()).limit(limit).offset(offset)
     result = await db.execute(stmt)
-    return [RescissionResponse.model_validate(r) for r in result.scalars().all()]
+    return result.scalars().all()
 
 
 @router.post("", response_model=RescissionResponse, status_code=status.HTTP_201_CREATED)
@@ -10,11 +10,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.database import get_db
 from app.core.deps import get_company_admin, require_permission
 from app.models.enums import ServiceOrderStatus
-from app.models.service import ServiceOrder, ServiceType
+from app.models.service import ServiceOrder, ServiceType, service_order_response_load
 from app.models.user import Profile
 from app.schemas.common import PaginatedResponse
 from app.schemas.service import (
@@ -25,6 +26,7 @@ from app.schemas.service import (
     ServiceTypeResponse,
     ServiceTypeUpdate,
 )
+from app.services.service_type_service import invalidate_service_types_cache
 
 router = APIRouter(prefix="/services", tags=["Admin Services"])
 
@@ -42,10 +44,11 @@ async def list_service_types(
     """List service types for the company."""
     rows = await db.execute(
         select(ServiceType)
+        .options(lazyload("*"))
         .where(ServiceType.company_id == admin.company_id)
         .order_by(ServiceType.name)
     )
-    return [ServiceTypeResponse.model_validate(s) for s in rows.scalars().all()]
+    return rows.scalars().all()
 
 
 @router.post("/types", response_model=ServiceTypeResponse, status_code=status.HTTP_201_CREATED)
@@ -58,6 +61,7 @@ async def create_service_type(
     st = ServiceType(company_id=admin.company_id, **data.model_dump())
     db.add(st)
     await db.flush()
+    invalidate_service_types_cache(db, admin.company_id)
     return ServiceTypeResponse.model_validate(st)
 
 
@@ -81,6 +85,7 @@ async def update_service_type(
     for k, v in data.model_dump(exclude_unset=True).items():
         setattr(st, k, v)
     await db.flush()
+    invalidate_service_types_cache(db, admin.company_id)
     return ServiceTypeResponse.model_validate(st)
 
 
@@ -117,6 +122,7 @@ async def delete_service_type(
 
     await db.delete(st)
     await db.flush()
+    invalidate_service_types_cache(db, admin.company_id)
 
 
 # ---------------------------------------------------------------------------
@@ -143,7 +149,8 @@ async def list_orders(
 
     total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar() or 0
     rows = await db.execute(
-        base.order_by(ServiceOrder.created_at.desc())
+        base.options(*service_order_response_load())
+        .order_by(ServiceOrder.created_at.desc())
         .offset((page - 1) * per_page)
         .limit(per_page)
     )
@@ -163,9 +170,9 @@ async def get_order(
 ):
     """Get service order details."""
     result = await db.execute(
-        select(ServiceOrder).where(
-            ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id
-        )
+        select(ServiceOrder)
+        .options(*service_order_response_load())
+        .where(ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id)
     )
     order = result.scalar_one_or_none()
     if not order:
@@ -182,9 +189,9 @@ async def update_order_status(
 ):
     """Update the status of a service order."""
     result = await db.execute(
-        select(ServiceOrder).where(
-            ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id
-        )
+        select(ServiceOrder)
+        .options(*service_order_response_load())
+        .where(ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id)
     )
     order = result.scalar_one_or_none()
     if not order:
@@ -210,9 +217,9 @@ async def update_order_financial(
 ):
     """Update cost / revenue of a service order."""
     result = await db.execute(
-        select(ServiceOrder).where(
-            ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id
-        )
+        select(ServiceOrder)
+        .options(*service_order_response_load())
+        .where(ServiceOrder.id == order_id, ServiceOrder.company_id == admin.company_id)
     )
     order = result.scalar_one_or_none()
     if not order:
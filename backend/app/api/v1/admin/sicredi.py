@@ -74,6 +74,31 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bulk action -> BatchOperation.type for POST /boletos/batch/operation.
+_BATCH_ACTION_TYPES = {
+    "BAIXA": "BATCH_BAIXA",
+    "ALTERAR_VENCIMENTO": "BATCH_ALTERAR_VENCIMENTO",
+    "ALTERAR_JUROS": "BATCH_ALTERAR_JUROS",
+    "ALTERAR_DESCONTO": "BATCH_ALTERAR_DESCONTO",
+    "CONCEDER_ABATIMENTO": "BATCH_CONCEDER_ABATIMENTO",
+    "CANCELAR_ABATIMENTO": "BATCH_CANCELAR_ABATIMENTO",
+    "NEGATIVACAO": "BATCH_NEGATIVACAO",
+    "SUSTAR_NEGATIVACAO_BAIXAR": "BATCH_SUSTAR_NEGATIVACAO_BAIXAR",
+}
+
+# Sicredi situacao -> local BoletoStatus for the single-boleto sync.
+_SITUACAO_STATUS = {
+    "LIQUIDADO": BoletoStatus.LIQUIDADO,
+    "BAIXADO": BoletoStatus.CANCELADO,
+    "BAIXADO POR SOLICITACAO": BoletoStatus.CANCELADO,
+    "VENCIDO": BoletoStatus.VENCIDO,
+    "NEGATIVADO": BoletoStatus.NEGATIVADO,
+    "NORMAL": BoletoStatus.NORMAL,
+}
+
+# Situações that mean the boleto was written off at Sicredi.
+_BAIXA_SITUACOES = frozenset(("BAIXADO", "BAIXADO POR SOLICITACAO"))
+
 
 async def sicredi_audit_trail():
     """Router-wide dependency: record every outbound Sicredi call made while
@@ -486,18 +511,7 @@ async def batch_operacao_boletos(
 
     Use GET /boletos/batch/{batch_id} to track progress.
     """
-    action_type_map = {
-        "BAIXA": "BATCH_BAIXA",
-        "ALTERAR_VENCIMENTO": "BATCH_ALTERAR_VENCIMENTO",
-        "ALTERAR_JUROS": "BATCH_ALTERAR_JUROS",
-        "ALTERAR_DESCONTO": "BATCH_ALTERAR_DESCONTO",
-        "CONCEDER_ABATIMENTO": "BATCH_CONCEDER_ABATIMENTO",
-        "CANCELAR_ABATIMENTO": "BATCH_CANCELAR_ABATIMENTO",
-        "NEGATIVACAO": "BATCH_NEGATIVACAO",
-        "SUSTAR_NEGATIVACAO_BAIXAR": "BATCH_SUSTAR_NEGATIVACAO_BAIXAR",
-    }
-
-    batch_type = action_type_map.get(payload.action)
+    batch_type = _BATCH_ACTION_TYPES.get(payload.action)
     if not batch_type:
         raise HTTPException(status_code=400, detail=f"Invalid action: {payload.action}")
 
@@ -863,7 +877,7 @@ async def sync_all_boletos(
             await mark_boleto_liquidado(db, boleto, source="sync_all_endpoint")
         else:
             boleto.status = new_status
-            if situacao in ("BAIXADO", "BAIXADO POR SOLICITACAO"):
+            if situacao in _BAIXA_SITUACOES:
                 if boleto.writeoff_type != WriteoffType.MANUAL_ADMIN:
                     boleto.writeoff_type = WriteoffType.BAIXA_EXTERNA
                     boleto.writeoff_reason = (
@@ -926,18 +940,10 @@ async def sync_boleto_status(
 
     situacao = (sicredi_data.situacao or "").upper()
 
-    _SITUACAO_MAP = {
-        "LIQUIDADO": BoletoStatus.LIQUIDADO,
-        "BAIXADO": BoletoStatus.CANCELADO,
-        "BAIXADO POR SOLICITACAO": BoletoStatus.CANCELADO,
-        "VENCIDO": BoletoStatus.VENCIDO,
-        "NEGATIVADO": BoletoStatus.NEGATIVADO,
-        "NORMAL": BoletoStatus.NORMAL,
-    }
-    new_status = _SITUACAO_MAP.get(situacao)
+    new_status = _SITUACAO_STATUS.get(situacao)
     
     # Track if this is an external baixa (not from our platform)
-    is_baixa_externa = situacao in ("BAIXADO", "BAIXADO POR SOLICITACAO")
+    is_baixa_externa = situacao in _BAIXA_SITUACOES
     
     if not new_status:
         # Record unknown situações so the mapping gap is visible in the audit trail
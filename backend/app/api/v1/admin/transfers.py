@@ -59,6 +59,15 @@ async def list_transfers(
     result = await db.execute(stmt)
     transfers = result.scalars().all()
 
+    # Resolve every lot label in one query instead of one per transfer.
+    lot_ids = {t.client_lot.lot_id for t in transfers if t.client_lot}
+    lot_labels: dict = {}
+    if lot_ids:
+        lot_rows = await db.execute(
+            select(Lot.id, Lot.block, Lot.lot_number).where(Lot.id.in_(lot_ids))
+        )
+        lot_labels = {r.id: f"Qd {r.block} Lt {r.lot_number}" for r in lot_rows.all()}
+
     responses = []
     for t in transfers:
         from_name = None
@@ -70,10 +79,7 @@ async def list_transfers(
         if t.to_client:
             to_name = t.to_client.full_name
         if t.client_lot:
-            lot_row = await db.execute(select(Lot.block, Lot.number).where(Lot.id == t.client_lot.lot_id))
-            lot_data = lot_row.one_or_none()
-            if lot_data:
-                lot_identifier = f"Qd {lot_data[0]} Lt {lot_data[1]}"
+            lot_identifier = lot_labels.get(t.client_lot.lot_id)
 
         resp = ContractTransferDetailResponse(
             **ContractTransferResponse.model_validate(t).model_dump(),
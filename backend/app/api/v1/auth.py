@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, invalidate_current_user
 
 _auth_limiter = Limiter(key_func=get_remote_address)
 from app.models.user import Profile
@@ -52,8 +52,13 @@ async def login(request: Request, data: LoginRequest, db: AsyncSession = Depends
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(current_user: Profile = Depends(get_current_user)):
-    """Logout (client-side token discard; placeholder for token blocklist)."""
+async def logout(request: Request, current_user: Profile = Depends(get_current_user)):
+    """Logout (client-side token discard; placeholder for token blocklist).
+
+    Drops this process's cached verification and profile so they are not
+    served from memory after the client discards the token.
+    """
+    invalidate_current_user(request)
     return None
 
 
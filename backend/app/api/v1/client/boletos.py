@@ -13,9 +13,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
+from app.core.deps import get_client_user, require_client_id
 from app.models.boleto import Boleto
-from app.models.client import Client
 from app.models.invoice import Invoice
 from app.models.client_lot import ClientLot
 from app.models.user import Profile
@@ -34,35 +33,24 @@ router = APIRouter(prefix="/boletos", tags=["Client Boletos"])
 # Local DB listing – MUST be before {nosso_numero} catch-all
 # ---------------------------------------------------------------------------
 
-async def _get_client_for_user(db: AsyncSession, user: Profile) -> Client:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = row.scalar_one_or_none()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-    return client
-
-
 @router.get("", response_model=list[BoletoListResponse])
 async def list_my_boletos(
     status: Optional[str] = Query(None, pattern=r"^(NORMAL|LIQUIDADO|VENCIDO|CANCELADO|NEGATIVADO|PENDING_APPROVAL)$"),
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """List all boletos from the local database for the authenticated client."""
-    client = await _get_client_for_user(db, user)
-
     query = (
         select(Boleto)
-        .where(Boleto.client_id == client.id, Boleto.company_id == user.company_id)
+        .where(Boleto.client_id == client_id, Boleto.company_id == user.company_id)
     )
     if status:
         query = query.where(Boleto.status == status)
 
     query = query.order_by(Boleto.data_vencimento.desc())
     rows = await db.execute(query)
-    return [BoletoListResponse.model_validate(b) for b in rows.scalars().all()]
+    return rows.scalars().all()
 
 
 # ---------------------------------------------------------------------------
@@ -70,32 +58,21 @@ async def list_my_boletos(
 # ---------------------------------------------------------------------------
 
 
-async def _get_client_for_user_sv(db: AsyncSession, user: Profile) -> Client:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = row.scalar_one_or_none()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-    return client
-
-
 @router.get("/segunda-via/preview/{invoice_id}")
 async def preview_segunda_via(
     invoice_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Preview corrected amount for an overdue invoice (penalty + interest)."""
-    client = await _get_client_for_user_sv(db, user)
-
     # Verify the invoice belongs to this client
     row = await db.execute(
         select(Invoice)
         .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
         .where(
             Invoice.id == invoice_id,
-            ClientLot.client_id == client.id,
+            ClientLot.client_id == client_id,
             Invoice.company_id == user.company_id,
         )
     )
@@ -127,17 +104,16 @@ async def issue_segunda_via(
     request: Request,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Issue a second copy boleto with automatic penalty/interest calculation."""
-    client = await _get_client_for_user_sv(db, user)
-
     # Verify the invoice belongs to this client
     row = await db.execute(
         select(Invoice)
         .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
         .where(
             Invoice.id == invoice_id,
-            ClientLot.client_id == client.id,
+            ClientLot.client_id == client_id,
             Invoice.company_id == user.company_id,
         )
     )
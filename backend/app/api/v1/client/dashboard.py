@@ -3,14 +3,16 @@
 
 from datetime import date
 from decimal import Decimal
+from typing import Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
-from app.models.client import Client
+from app.core.deps import get_client_id, get_client_user
 from app.models.client_lot import ClientLot
 from app.models.development import Development
 from app.models.enums import InvoiceStatus
@@ -19,7 +21,7 @@ from app.models.lot import Lot
 from app.models.user import Profile
 from app.schemas.dashboard import ClientSummary, RecentActivity
 from app.schemas.lot import ClientLotResponse
-from app.services.storage_service import enrich_photos
+from app.services.storage_service import enrich_photo_lists
 
 router = APIRouter(prefix="/dashboard", tags=["Client Dashboard"])
 
@@ -33,39 +35,44 @@ def _get_client_filter(profile: Profile):
 async def client_summary(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: Optional[UUID] = Depends(get_client_id),
 ):
     """Summary for the client portal."""
-    client_row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = client_row.scalar_one_or_none()
-    if not client:
+    if client_id is None:
         return ClientSummary()
 
-    lots_count = 0
-    next_due_date = None
-    next_due_amount = None
-    pending = 0
-    overdue = 0
+    # Everything the summary shows in one round trip: each figure is an
+    # independent scalar subquery, so only a single row comes back.
+    def _invoices(col, status: InvoiceStatus):
+        return (
+            select(col)
+            .select_from(Invoice)
+            .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
+            .where(ClientLot.client_id == client_id, Invoice.status == status)
+        )
 
-    cl_rows = await db.execute(
-        select(ClientLot).where(ClientLot.client_id == client.id)
-    )
-    client_lots = cl_rows.scalars().all()
-    lots_count = len(client_lots)
+    def _next_due(col):
+        return (
+            _invoices(col, InvoiceStatus.PENDING)
+            # id tie-break keeps the date and amount on the same invoice.
+            .order_by(Invoice.due_date, Invoice.id)
+            .limit(1)
+            .scalar_subquery()
+        )
 
-    for cl in client_lots:
-        inv_rows = await db.execute(
-            select(Invoice).where(Invoice.client_lot_id == cl.id)
+    row = (await db.execute(
+        select(
+            select(func.count())
+            .select_from(ClientLot)
+            .where(ClientLot.client_id == client_id)
+            .scalar_subquery(),
+            _invoices(func.count(), InvoiceStatus.PENDING).scalar_subquery(),
+            _invoices(func.count(), InvoiceStatus.OVERDUE).scalar_subquery(),
+            _next_due(Invoice.due_date),
+            _next_due(Invoice.amount),
         )
-        for inv in inv_rows.scalars().all():
-            if inv.status == InvoiceStatus.PENDING:
-                pending += 1
-                if next_due_date is None or inv.due_date < next_due_date:
-                    next_due_date = inv.due_date
-                    next_due_amount = inv.amount
-            elif inv.status == InvoiceStatus.OVERDUE:
-                overdue += 1
+    )).one()
+    lots_count, pending, overdue, next_due_date, next_due_amount = row
 
     return ClientSummary(
         total_lots=lots_count,
@@ -80,43 +87,46 @@ async def client_summary(
 async def my_lots(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: Optional[UUID] = Depends(get_client_id),
 ):
     """List lots owned by the current client."""
-    client_row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = client_row.scalar_one_or_none()
-    if not client:
+    if client_id is None:
         return []
 
+    # Contracts, their lots and developments in one joined query; the
+    # selectin cascades on ClientLot are not needed for this response.
     rows = await db.execute(
-        select(ClientLot).where(ClientLot.client_id == client.id)
+        select(
+            ClientLot,
+            Lot.id.label("found_lot_id"),
+            Lot.lot_number,
+            Lot.block,
+            Lot.photos.label("lot_photos"),
+            Development.name.label("development_name"),
+            Development.photos.label("development_photos"),
+        )
+        .options(lazyload("*"))
+        .outerjoin(Lot, Lot.id == ClientLot.lot_id)
+        .outerjoin(Development, Development.id == Lot.development_id)
+        .where(ClientLot.client_id == client_id)
     )
-    client_lots = rows.scalars().all()
-
-    # Preload lots + developments to attach the photos the admin exposed.
-    lot_ids = [cl.lot_id for cl in client_lots]
-    lots_by_id: dict = {}
-    devs_by_id: dict = {}
-    if lot_ids:
-        lot_rows = await db.execute(select(Lot).where(Lot.id.in_(lot_ids)))
-        lots_by_id = {lot.id: lot for lot in lot_rows.scalars().all()}
-        dev_ids = {lot.development_id for lot in lots_by_id.values()}
-        if dev_ids:
-            dev_rows = await db.execute(select(Development).where(Development.id.in_(dev_ids)))
-            devs_by_id = {dev.id: dev for dev in dev_rows.scalars().all()}
 
+    contracts = rows.all()
+    # Both galleries of every contract are signed in one Storage request.
+    galleries = iter(await enrich_photo_lists(
+        [photos for r in contracts for photos in (r.lot_photos, r.development_photos)],
+        only_visible=True,
+    ))
     result = []
-    for cl in client_lots:
-        data = ClientLotResponse.model_validate(cl).model_dump()
-        lot = lots_by_id.get(cl.lot_id)
-        if lot:
-            dev = devs_by_id.get(lot.development_id)
-            data["lot_number"] = lot.lot_number
-            data["block"] = lot.block
-            data["development_name"] = dev.name if dev else None
-            data["lot_photos"] = enrich_photos(lot.photos or [], only_visible=True)
-            data["development_photos"] = enrich_photos(dev.photos or [], only_visible=True) if dev else []
+    for r in contracts:
+        data = ClientLotResponse.model_validate(r.ClientLot).model_dump()
+        lot_photos, development_photos = next(galleries), next(galleries)
+        if r.found_lot_id is not None:
+            data["lot_number"] = r.lot_number
+            data["block"] = r.block
+            data["development_name"] = r.development_name
+            data["lot_photos"] = lot_photos
+            data["development_photos"] = development_photos
         result.append(data)
     return result
 
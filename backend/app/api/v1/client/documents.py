@@ -7,15 +7,21 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
-from app.models.client import Client
+from app.core.deps import get_client_user, require_client_id
 from app.models.client_document import ClientDocument
 from app.models.enums import DocumentStatus, DocumentType
 from app.models.user import Profile
 from app.schemas.client_document import ClientDocumentResponse
-from app.services.storage_service import delete_file, get_public_url, upload_file
+from app.services.storage_service import (
+    delete_file,
+    get_public_url,
+    get_signed_urls,
+    read_upload,
+    upload_file,
+)
 from app.utils.exceptions import StorageError
 
 router = APIRouter(prefix="/documents", tags=["Client Documents"])
@@ -24,38 +30,39 @@ ALLOWED_CONTENT_TYPES = {"application/pdf", "image/jpeg", "image/png", "image/jp
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
-async def _get_client(db: AsyncSession, user: Profile) -> Client:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = row.scalar_one_or_none()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-    return client
-
-
-def _enrich_response(doc: ClientDocument) -> dict:
+async def _enrich_response(doc: ClientDocument) -> dict:
     """Add file_url to the response."""
     resp = ClientDocumentResponse.model_validate(doc).model_dump()
     try:
-        resp["file_url"] = get_public_url(doc.file_path)
+        resp["file_url"] = await get_public_url(doc.file_path)
     except Exception:
         resp["file_url"] = None
     return resp
 
 
+async def _enrich_many(docs) -> list[dict]:
+    """Add file_url to a list of documents, signed in one Storage request."""
+    urls = await get_signed_urls([d.file_path for d in docs if d.file_path])
+    out = []
+    for doc in docs:
+        resp = ClientDocumentResponse.model_validate(doc).model_dump()
+        resp["file_url"] = urls.get(doc.file_path)
+        out.append(resp)
+    return out
+
+
 @router.get("", response_model=list[ClientDocumentResponse])
 async def list_documents(
     document_type: Optional[str] = None,
     doc_status: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """List all structured documents for the current client."""
-    client = await _get_client(db, user)
-
-    query = select(ClientDocument).where(
-        ClientDocument.client_id == client.id,
+    # Flat response: skip the selectin client/reviewer cascade.
+    query = select(ClientDocument).options(lazyload("*")).where(
+        ClientDocument.client_id == client_id,
         ClientDocument.company_id == user.company_id,
         # Only documents the admin chose to expose (client's own uploads are
         # stored with visible_to_client=True so they remain visible to them).
@@ -68,7 +75,7 @@ async def list_documents(
 
     query = query.order_by(ClientDocument.created_at.desc())
     rows = await db.execute(query)
-    return [_enrich_response(d) for d in rows.scalars().all()]
+    return await _enrich_many(rows.scalars().all())
 
 
 @router.post("/upload", response_model=ClientDocumentResponse, status_code=status.HTTP_201_CREATED)
@@ -78,10 +85,9 @@ async def upload_document(
     description: Optional[str] = Form(None, max_length=500),
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Upload a document with type classification."""
-    client = await _get_client(db, user)
-
     # Validate content type
     if file.content_type not in ALLOWED_CONTENT_TYPES:
         raise HTTPException(
@@ -90,12 +96,10 @@ async def upload_document(
         )
 
     # Read and validate size
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File exceeds maximum size of {MAX_FILE_SIZE // (1024*1024)} MB",
-        )
+    try:
+        contents = await read_upload(file, MAX_FILE_SIZE)
+    except StorageError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.detail) from exc
 
     # Upload to Supabase Storage
     try:
@@ -103,7 +107,7 @@ async def upload_document(
             file_bytes=contents,
             original_filename=file.filename or "upload",
             company_id=str(user.company_id),
-            subfolder=f"clients/{client.id}/documents",
+            subfolder=f"clients/{client_id}/documents",
         )
     except StorageError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.detail) from exc
@@ -111,7 +115,7 @@ async def upload_document(
     # Create record in dedicated table
     doc = ClientDocument(
         company_id=user.company_id,
-        client_id=client.id,
+        client_id=client_id,
         document_type=DocumentType(document_type),
         file_name=file.filename or "upload",
         file_path=file_path,
@@ -123,7 +127,7 @@ async def upload_document(
     db.add(doc)
     await db.flush()
 
-    return _enrich_response(doc)
+    return await _enrich_response(doc)
 
 
 @router.get("/{document_id}", response_model=ClientDocumentResponse)
@@ -131,14 +135,13 @@ async def get_document(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Get details of a specific document."""
-    client = await _get_client(db, user)
-
     row = await db.execute(
         select(ClientDocument).where(
             ClientDocument.id == document_id,
-            ClientDocument.client_id == client.id,
+            ClientDocument.client_id == client_id,
             ClientDocument.company_id == user.company_id,
             ClientDocument.visible_to_client.is_(True),
         )
@@ -147,7 +150,7 @@ async def get_document(
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return _enrich_response(doc)
+    return await _enrich_response(doc)
 
 
 @router.get("/{document_id}/download")
@@ -155,14 +158,13 @@ async def download_document(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Redirect to the public URL for document download."""
-    client = await _get_client(db, user)
-
     row = await db.execute(
         select(ClientDocument).where(
             ClientDocument.id == document_id,
-            ClientDocument.client_id == client.id,
+            ClientDocument.client_id == client_id,
             ClientDocument.company_id == user.company_id,
             ClientDocument.visible_to_client.is_(True),
         )
@@ -172,7 +174,7 @@ async def download_document(
         raise HTTPException(status_code=404, detail="Document not found")
 
     try:
-        url = get_public_url(doc.file_path)
+        url = await get_public_url(doc.file_path)
     except Exception:
         raise HTTPException(status_code=404, detail="File not available in storage")
 
@@ -185,14 +187,13 @@ async def delete_document(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Delete a document (only if still PENDING_REVIEW)."""
-    client = await _get_client(db, user)
-
     row = await db.execute(
         select(ClientDocument).where(
             ClientDocument.id == document_id,
-            ClientDocument.client_id == client.id,
+            ClientDocument.client_id == client_id,
             ClientDocument.company_id == user.company_id,
             ClientDocument.visible_to_client.is_(True),
         )
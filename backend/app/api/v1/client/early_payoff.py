@@ -8,7 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
+from app.core.deps import get_client_user, require_client_id
 from app.models.client import Client
 from app.models.client_lot import ClientLot
 from app.models.early_payoff_request import EarlyPayoffRequest
@@ -24,30 +24,19 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/early-payoff", tags=["Client Early Payoff"])
 
 
-async def _get_client_for_user(db: AsyncSession, user: Profile) -> Client:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = row.scalar_one_or_none()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-    return client
-
-
 @router.post("", response_model=EarlyPayoffResponse, status_code=status.HTTP_201_CREATED)
 async def request_early_payoff(
     payload: EarlyPayoffCreate,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Client requests early payoff for one of their lots. Admin is notified."""
-    client = await _get_client_for_user(db, user)
-
     # Verify the client_lot belongs to this client and is active
     cl_row = await db.execute(
         select(ClientLot).where(
             ClientLot.id == payload.client_lot_id,
-            ClientLot.client_id == client.id,
+            ClientLot.client_id == client_id,
             ClientLot.company_id == user.company_id,
             ClientLot.status == ClientLotStatus.ACTIVE,
         )
@@ -59,7 +48,7 @@ async def request_early_payoff(
     # Check for existing pending request
     existing = await db.execute(
         select(EarlyPayoffRequest).where(
-            EarlyPayoffRequest.client_id == client.id,
+            EarlyPayoffRequest.client_id == client_id,
             EarlyPayoffRequest.client_lot_id == payload.client_lot_id,
             EarlyPayoffRequest.status == EarlyPayoffStatus.PENDING,
         )
@@ -69,7 +58,7 @@ async def request_early_payoff(
 
     req = EarlyPayoffRequest(
         company_id=user.company_id,
-        client_id=client.id,
+        client_id=client_id,
         client_lot_id=payload.client_lot_id,
         status=EarlyPayoffStatus.PENDING,
         client_message=payload.client_message,
@@ -77,22 +66,24 @@ async def request_early_payoff(
     db.add(req)
     await db.flush()
 
-    # Notify admins
+    # Notify admins (only the name is needed, not the full Client row)
+    client_name = (await db.execute(
+        select(Client.full_name).where(Client.id == client_id)
+    )).scalar_one()
     try:
         await create_notification(
             db,
             company_id=user.company_id,
             notification_type=NotificationType.ANTECIPACAO_SOLICITADA,
             title="Solicitação de Antecipação",
-            message=f"Cliente {client.full_name} solicitou antecipação de pagamento.",
-            data={"request_id": str(req.id), "client_id": str(client.id)},
+            message=f"Cliente {client_name} solicitou antecipação de pagamento.",
+            data={"request_id": str(req.id), "client_id": str(client_id)},
         )
     except Exception as exc:
         logger.warning("early_payoff_notification_failed", error=str(exc))
 
     await db.commit()
-    await db.refresh(req)
-    logger.info("early_payoff_requested", request_id=str(req.id), client_id=str(client.id))
+    logger.info("early_payoff_requested", request_id=str(req.id), client_id=str(client_id))
     return EarlyPayoffResponse.model_validate(req)
 
 
@@ -100,16 +91,15 @@ async def request_early_payoff(
 async def list_my_requests(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """List the client's own early payoff requests."""
-    client = await _get_client_for_user(db, user)
-
     rows = await db.execute(
         select(EarlyPayoffRequest)
         .where(
-            EarlyPayoffRequest.client_id == client.id,
+            EarlyPayoffRequest.client_id == client_id,
             EarlyPayoffRequest.company_id == user.company_id,
         )
         .order_by(EarlyPayoffRequest.requested_at.desc())
     )
-    return [EarlyPayoffResponse.model_validate(r) for r in rows.scalars().all()]
+    return rows.scalars().all()
@@ -7,10 +7,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
-from app.models.client import Client
+from app.core.deps import get_client_user, get_client_id, require_client_id
 from app.models.client_lot import ClientLot
 from app.models.invoice import Invoice
 from app.models.user import Profile
@@ -19,35 +19,30 @@ from app.schemas.invoice import InvoiceResponse
 router = APIRouter(prefix="/invoices", tags=["Client Invoices"])
 
 
-async def _get_client(db: AsyncSession, user: Profile) -> Optional[Client]:
-    """Retrieve the Client record linked to the current profile."""
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    return row.scalar_one_or_none()
-
-
 @router.get("", response_model=list[InvoiceResponse])
 async def list_invoices(
     lot_id: Optional[UUID] = None,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: Optional[UUID] = Depends(get_client_id),
 ):
     """List invoices for the current client."""
-    client = await _get_client(db, user)
-    if not client:
+    if client_id is None:
         return []
 
+    # InvoiceResponse is flat: skip the selectin client_lot/boletos cascade,
+    # which would otherwise re-load each contract with its lot and invoices.
     base = (
         select(Invoice)
+        .options(lazyload("*"))
         .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
-        .where(ClientLot.client_id == client.id, Invoice.company_id == user.company_id)
+        .where(ClientLot.client_id == client_id, Invoice.company_id == user.company_id)
     )
     if lot_id:
         base = base.where(ClientLot.lot_id == lot_id)
 
     rows = await db.execute(base.order_by(Invoice.due_date))
-    return [InvoiceResponse.model_validate(r) for r in rows.scalars().all()]
+    return [InvoiceResponse.from_invoice(r) for r in rows.scalars().all()]
 
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
@@ -55,18 +50,16 @@ async def get_invoice(
     invoice_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Get invoice details (with barcode and payment URL)."""
-    client = await _get_client(db, user)
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-
     row = await db.execute(
         select(Invoice)
+        .options(lazyload("*"))
         .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
         .where(
             Invoice.id == invoice_id,
-            ClientLot.client_id == client.id,
+            ClientLot.client_id == client_id,
             Invoice.company_id == user.company_id,
         )
     )
@@ -82,18 +75,16 @@ async def download_invoice_pdf(
     invoice_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Redirect to the payment URL for PDF download."""
-    client = await _get_client(db, user)
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-
     row = await db.execute(
         select(Invoice)
+        .options(lazyload("*"))
         .join(ClientLot, ClientLot.id == Invoice.client_lot_id)
         .where(
             Invoice.id == invoice_id,
-            ClientLot.client_id == client.id,
+            ClientLot.client_id == client_id,
             Invoice.company_id == user.company_id,
         )
     )
@@ -2,44 +2,40 @@ from typing import Optional
 
 """Client profile endpoints – view and update own profile."""
 
-from datetime import datetime, timezone
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.audit import log_audit
 from app.core.database import get_db
-from app.core.deps import get_client_user
+from app.core.deps import get_client_user, require_client_id
 from app.models.client import Client
 from app.models.user import Profile
 from app.schemas.client import ClientProfileResponse, ClientProfileUpdate
-from app.services.storage_service import get_public_url, upload_file
+from app.services.storage_service import get_public_url, read_upload, upload_file
 from app.utils.exceptions import StorageError
 
 router = APIRouter(prefix="/profile", tags=["Client Profile"])
 
 
-def _profile_response(client: Client) -> ClientProfileResponse:
+async def _profile_response(client: Client) -> ClientProfileResponse:
     """Serialize the client profile, resolving the stored photo path to a URL."""
     resp = ClientProfileResponse.model_validate(client)
     if client.photo_url:
         try:
-            resp.photo_url = get_public_url(client.photo_url)
+            resp.photo_url = await get_public_url(client.photo_url)
         except Exception:
             pass
     return resp
 
 
-async def _get_client(db: AsyncSession, user: Profile) -> Client:
-    """Retrieve the Client record linked to the current profile."""
-    row = await db.execute(
-        select(Client).where(
-            Client.profile_id == user.id,
-            Client.company_id == user.company_id,
-        )
-    )
-    client = row.scalar_one_or_none()
+async def _get_client(db: AsyncSession, client_id: UUID) -> Client:
+    """Load the Client record already resolved for the current profile."""
+    # The profile endpoints only touch the client's own columns, so skip the
+    # model's selectin relationships (profile, creator, lots, boletos).
+    client = await db.get(Client, client_id, options=[lazyload("*")])
     if not client:
         raise HTTPException(status_code=404, detail="Client profile not found")
     return client
@@ -49,10 +45,11 @@ async def _get_client(db: AsyncSession, user: Profile) -> Client:
 async def get_profile(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Return the authenticated client's profile data."""
-    client = await _get_client(db, user)
-    return _profile_response(client)
+    client = await _get_client(db, client_id)
+    return await _profile_response(client)
 
 
 @router.patch("", response_model=ClientProfileResponse)
@@ -61,9 +58,10 @@ async def update_profile(
     request: Request,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Update limited fields on the client's own profile."""
-    client = await _get_client(db, user)
+    client = await _get_client(db, client_id)
 
     changed_fields = {}
     for field, value in updates.model_dump(exclude_unset=True).items():
@@ -73,9 +71,8 @@ async def update_profile(
             changed_fields[field] = {"old": str(old_value), "new": str(value)}
 
     if not changed_fields:
-        return _profile_response(client)
+        return await _profile_response(client)
 
-    client.updated_at = datetime.now(timezone.utc)
     await db.flush()
 
     await log_audit(
@@ -89,7 +86,7 @@ async def update_profile(
         ip_address=request.client.host if request.client else None,
     )
 
-    return _profile_response(client)
+    return await _profile_response(client)
 
 
 @router.post("/photo", response_model=ClientProfileResponse)
@@ -98,12 +95,13 @@ async def upload_profile_photo(
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Upload/replace the authenticated client's own profile photo."""
-    client = await _get_client(db, user)
+    client = await _get_client(db, client_id)
 
     try:
-        contents = await file.read()
+        contents = await read_upload(file)
         path = await upload_file(
             file_bytes=contents,
             original_filename=file.filename or "photo",
@@ -127,4 +125,4 @@ async def upload_profile_photo(
         ip_address=request.client.host if request.client else None,
     )
 
-    return _profile_response(client)
+    return await _profile_response(client)
@@ -9,8 +9,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
-from app.models.client import Client
+from app.core.deps import get_client_user, require_client_id
 from app.models.enums import ServiceRequestStatus, ServiceRequestType, ServiceRequestPriority
 from app.models.service_request import ServiceRequest, ServiceRequestMessage
 from app.models.user import Profile
@@ -26,16 +25,6 @@ from app.schemas.service_request import (
 router = APIRouter(prefix="/service-requests", tags=["Client Service Requests"])
 
 
-async def _get_client(db: AsyncSession, user: Profile) -> Client:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    client = row.scalar_one_or_none()
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-    return client
-
-
 async def _generate_ticket_number(db: AsyncSession, company_id) -> str:
     """Generate a unique ticket number: REQ-YYYY-NNNN."""
     from datetime import datetime, timezone
@@ -72,15 +61,14 @@ async def create_service_request(
     body: ServiceRequestCreate,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Create a new service request (support ticket)."""
-    client = await _get_client(db, user)
-
     ticket_number = await _generate_ticket_number(db, user.company_id)
 
     sr = ServiceRequest(
         company_id=user.company_id,
-        client_id=client.id,
+        client_id=client_id,
         ticket_number=ticket_number,
         service_type=ServiceRequestType(body.service_type),
         subject=body.subject,
@@ -113,12 +101,11 @@ async def list_service_requests(
     per_page: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """List service requests for the authenticated client."""
-    client = await _get_client(db, user)
-
     base = select(ServiceRequest).where(
-        ServiceRequest.client_id == client.id,
+        ServiceRequest.client_id == client_id,
         ServiceRequest.company_id == user.company_id,
     )
     if req_status:
@@ -147,14 +134,13 @@ async def get_service_request(
     request_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Get service request details with messages (excludes internal messages)."""
-    client = await _get_client(db, user)
-
     row = await db.execute(
         select(ServiceRequest).where(
             ServiceRequest.id == request_id,
-            ServiceRequest.client_id == client.id,
+            ServiceRequest.client_id == client_id,
             ServiceRequest.company_id == user.company_id,
         )
     )
@@ -184,14 +170,13 @@ async def add_message(
     body: ServiceRequestMessageCreate,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Add a message to an existing service request."""
-    client = await _get_client(db, user)
-
     row = await db.execute(
         select(ServiceRequest).where(
             ServiceRequest.id == request_id,
-            ServiceRequest.client_id == client.id,
+            ServiceRequest.client_id == client_id,
             ServiceRequest.company_id == user.company_id,
         )
     )
@@ -8,42 +8,31 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.database import get_db
-from app.core.deps import get_client_user
+from app.core.deps import get_client_user, get_client_id, require_client_id
 from app.models.client import Client
 from app.models.enums import ServiceOrderStatus
-from app.models.service import ServiceOrder, ServiceType
+from app.models.service import ServiceOrder, ServiceType, service_order_response_load
 from app.models.user import Profile
 from app.schemas.service import (
     ServiceOrderCreate,
     ServiceOrderResponse,
     ServiceTypeResponse,
 )
+from app.services.service_type_service import list_active_service_types
 
 router = APIRouter(prefix="/services", tags=["Client Services"])
 
 
-async def _get_client(db: AsyncSession, user: Profile) -> Optional[Client]:
-    row = await db.execute(
-        select(Client).where(Client.profile_id == user.id, Client.company_id == user.company_id)
-    )
-    return row.scalar_one_or_none()
-
-
 @router.get("/types", response_model=list[ServiceTypeResponse])
 async def list_available_services(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
 ):
     """List active service types available to the client."""
-    rows = await db.execute(
-        select(ServiceType).where(
-            ServiceType.company_id == user.company_id,
-            ServiceType.is_active.is_(True),
-        )
-    )
-    return [ServiceTypeResponse.model_validate(s) for s in rows.scalars().all()]
+    return await list_active_service_types(db, user.company_id)
 
 
 @router.post("/orders", response_model=ServiceOrderResponse, status_code=status.HTTP_201_CREATED)
@@ -51,28 +40,32 @@ async def request_service(
     data: ServiceOrderCreate,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Client requests a service."""
-    client = await _get_client(db, user)
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-
-    # Validate service type
-    st = (await db.execute(
-        select(ServiceType).where(
+    # Validate the service type and load the requesting client in the same
+    # round trip; both are attached to the order so the response names need
+    # no further queries.
+    row = (await db.execute(
+        select(ServiceType, Client)
+        .options(lazyload("*"))
+        .join(Client, Client.company_id == ServiceType.company_id)
+        .where(
             ServiceType.id == data.service_type_id,
             ServiceType.company_id == user.company_id,
             ServiceType.is_active.is_(True),
+            Client.id == client_id,
         )
-    )).scalar_one_or_none()
-    if not st:
+    )).one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Service type not found or inactive")
+    st, client = row
 
     order = ServiceOrder(
         company_id=user.company_id,
-        client_id=client.id,
+        client=client,
+        service_type=st,
         lot_id=data.lot_id,
-        service_type_id=data.service_type_id,
         requested_date=date.today(),
         status=ServiceOrderStatus.REQUESTED,
         notes=data.notes,
@@ -86,15 +79,16 @@ async def request_service(
 async def my_orders(
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: Optional[UUID] = Depends(get_client_id),
 ):
     """List service orders for the current client."""
-    client = await _get_client(db, user)
-    if not client:
+    if client_id is None:
         return []
 
     rows = await db.execute(
         select(ServiceOrder)
-        .where(ServiceOrder.client_id == client.id, ServiceOrder.company_id == user.company_id)
+        .options(*service_order_response_load())
+        .where(ServiceOrder.client_id == client_id, ServiceOrder.company_id == user.company_id)
         .order_by(ServiceOrder.created_at.desc())
     )
     return [ServiceOrderResponse.from_order(r) for r in rows.scalars().all()]
@@ -105,16 +99,15 @@ async def get_order(
     order_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Get service order details."""
-    client = await _get_client(db, user)
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-
     row = await db.execute(
-        select(ServiceOrder).where(
+        select(ServiceOrder)
+        .options(*service_order_response_load())
+        .where(
             ServiceOrder.id == order_id,
-            ServiceOrder.client_id == client.id,
+            ServiceOrder.client_id == client_id,
             ServiceOrder.company_id == user.company_id,
         )
     )
@@ -129,16 +122,15 @@ async def cancel_order(
     order_id: UUID,
     db: AsyncSession = Depends(get_db),
     user: Profile = Depends(get_client_user),
+    client_id: UUID = Depends(require_client_id),
 ):
     """Client cancels their own service request (only while not yet completed)."""
-    client = await _get_client(db, user)
-    if not client:
-        raise HTTPException(status_code=404, detail="Client profile not found")
-
     row = await db.execute(
-        select(ServiceOrder).where(
+        select(ServiceOrder)
+        .options(*service_order_response_load())
+        .where(
             ServiceOrder.id == order_id,
-            ServiceOrder.client_id == client.id,
+            ServiceOrder.client_id == client_id,
             ServiceOrder.company_id == user.company_id,
         )
     )
@@ -20,12 +20,13 @@ yet support authentication on webhooks; an optional IP whitelist is enforced
 when configured.
 """
 
-import json
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.core.config import settings
 from app.core.database import get_db
@@ -50,7 +51,7 @@ def _verify_sicredi_origin(request: Request) -> bool:
     if not settings.WEBHOOK_IP_WHITELIST:
         return True
     client_ip = request.client.host if request.client else None
-    if client_ip not in settings.WEBHOOK_IP_WHITELIST:
+    if client_ip not in settings.webhook_ip_whitelist_set:
         logger.warning("sicredi_webhook_ip_rejected", ip=client_ip)
         return False
     return True
@@ -127,7 +128,7 @@ async def sicredi_webhook(
     # 1) Undecodable body: record it and acknowledge (returning 4xx just makes
     # Sicredi mark the event undelivered — we already captured it for auditing).
     try:
-        body = json.loads(raw) if raw else None
+        body = orjson.loads(raw) if raw else None
     except Exception as exc:
         logger.warning("sicredi_webhook_unparseable_body", error=str(exc))
         await log_sicredi_event(
@@ -179,12 +180,19 @@ async def sicredi_webhook(
         # Look up boleto (and legacy invoice-by-barcode) for this event.
         boleto = None
         invoice = None
+        # Only the rows' own columns are read here, so skip the selectin
+        # cascades (client, creator, contract, sibling boletos) that would
+        # otherwise turn each lookup into several queries per event.
         if nosso_numero:
             boleto = (
-                await db.execute(select(Boleto).where(Boleto.nosso_numero == nosso_numero))
+                await db.execute(
+                    select(Boleto).options(lazyload("*")).where(Boleto.nosso_numero == nosso_numero)
+                )
             ).scalar_one_or_none()
             invoice = (
-                await db.execute(select(Invoice).where(Invoice.barcode == nosso_numero))
+                await db.execute(
+                    select(Invoice).options(lazyload("*")).where(Invoice.barcode == nosso_numero)
+                )
             ).scalar_one_or_none()
 
         company_id = await _resolve_company_id(db, event, boleto)
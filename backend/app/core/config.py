@@ -2,6 +2,7 @@
 """Application settings loaded from environment variables."""
 
 import json
+from functools import cached_property
 from typing import Any
 
 from pydantic import field_validator
@@ -29,6 +30,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -85,12 +90,19 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.APP_ENV == "production"
 
-    @property
+    # Derived values are computed once per Settings instance: the fields are
+    # fixed after startup.
+    @cached_property
     def supabase_jwt_jwk(self) -> dict:
         """Parse the Supabase JWT secret as JWK dict."""
         return json.loads(self.SUPABASE_JWT_SECRET)
 
-    @property
+    @cached_property
+    def webhook_ip_whitelist_set(self) -> frozenset[str]:
+        """WEBHOOK_IP_WHITELIST as a set for per-request membership checks."""
+        return frozenset(self.WEBHOOK_IP_WHITELIST)
+
+    @cached_property
     def database_url_sync(self) -> str:
         """Return sync database URL for Alembic."""
         return self.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
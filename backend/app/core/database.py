@@ -1,8 +1,11 @@
 
 """Database engine, session factory, and base model for SQLAlchemy 2.0 async."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,12 +14,20 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
+    # Safe behind the Supabase transaction pooler (Supavisor, port 6543),
+    # where a backend connection is not pinned to ours between transactions:
+    # both statement caches are off, and every prepared statement gets a
+    # unique name so names can't collide on a shared backend.
     connect_args={
         "command_timeout": 60,
         "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
     },
 )
 
@@ -33,6 +44,25 @@ class Base(DeclarativeBase):
     pass
 
 
+async def warm_up_pool(connections: int = 5) -> None:
+    """Open *connections* pooled connections ahead of the first request.
+
+    Moves the asyncpg connect / TLS handshake cost from the first requests of
+    a fresh worker to application startup.
+    """
+
+    async def _checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(connections)))
+
+
+async def dispose_pool() -> None:
+    """Close every pooled connection (application shutdown)."""
+    await engine.dispose()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session and ensure cleanup."""
     async with async_session_factory() as session:
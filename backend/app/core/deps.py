@@ -1,16 +1,22 @@
 
 """FastAPI dependencies: authentication, authorization, database sessions."""
+import asyncio
+import hashlib
+import time
 from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
 from app.core.database import get_db
-from app.core.security import UserRole, decode_token
+from app.core.security import UserRole, decode_internal_token, decode_supabase_token
+from app.models.client import Client
 from app.models.user import Profile
+from app.utils.cache import TTLCache, pop_after_commit
 from app.utils.exceptions import (
     AuthenticationError,
     InsufficientPermissionsError,
@@ -20,7 +26,111 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-bearer_scheme = HTTPBearer(auto_error=False)
+# Shared, never-mutated header mapping for 401 responses.  The exceptions
+# themselves are still created per raise: a module-level instance would
+# accumulate __traceback__/__context__ across raises and leak frames.
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _bearer_token(request: Request) -> Optional[str]:
+    """Return the token from an ``Authorization: Bearer`` header, if any.
+
+    Parsed inline (same rules as ``HTTPBearer(auto_error=False)``) so guarded
+    routes don't carry an extra security dependency node.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+# Verified token claims keyed by a digest of the raw bearer token.  Signature
+# checks (HS256, then the ES256 fallback) are repeated for the same token on
+# every request; entries never outlive the token's own ``exp``.
+TOKEN_CACHE_MAX_TTL_SECONDS = 300
+_token_cache = TTLCache(maxsize=4096, ttl=TOKEN_CACHE_MAX_TTL_SECONDS)
+
+# Rejected tokens, so a replayed bad/expired token is refused with a dict
+# lookup instead of re-running both signature checks on every attempt.
+BAD_TOKEN_CACHE_TTL_SECONDS = 60
+_bad_token_cache = TTLCache(maxsize=8192, ttl=BAD_TOKEN_CACHE_TTL_SECONDS)
+
+# Authenticated (profile column values, client_id) keyed by user id, so
+# repeat requests within the window skip the profile query.  Only plain
+# values are cached, never the ORM instance: an instance belongs to the
+# session that loaded it and is expired/detached by that session's rollback.
+# The password hash is never cached; it stays unloaded on a cache-built
+# profile and is read from the row by whichever query next loads it.
+# The short TTL bounds staleness across workers; in-process writers that
+# deactivate, delete or edit a profile call invalidate_profile_cache().
+PROFILE_CACHE_TTL_SECONDS = 30
+_profile_cache = TTLCache(maxsize=4096, ttl=PROFILE_CACHE_TTL_SECONDS)
+_PROFILE_COLUMNS = tuple(
+    attr.key for attr in Profile.__mapper__.column_attrs if attr.key != "hashed_password"
+)
+
+
+def invalidate_profile_cache(db: AsyncSession, user_id: UUID) -> None:
+    """Drop the cached auth profile for *user_id* once *db* commits a change to it."""
+    pop_after_commit(db, _profile_cache, user_id)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_token(token: str) -> None:
+    """Drop the cached verification of *token*."""
+    _token_cache.pop(_token_cache_key(token), None)
+
+
+def invalidate_current_user(request: Request) -> None:
+    """Drop the cached token and profile behind *request* (call on logout)."""
+    raw_token = _bearer_token(request)
+    if raw_token is not None:
+        invalidate_token(raw_token)
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        _profile_cache.pop(user_id, None)
+
+
+async def _decode_token(token: str) -> dict:
+    """Async counterpart of security.decode_token.
+
+    The HS256 check is microseconds and stays inline; the ES256 (Supabase)
+    fallback is an EC signature verification, so it runs in a worker thread
+    instead of blocking the event loop.
+    """
+    try:
+        return decode_internal_token(token)
+    except InvalidTokenError:
+        return await asyncio.to_thread(decode_supabase_token, token)
+
+
+async def _decode_token_cached(token: str) -> dict:
+    """Return the verified payload for *token*, reusing a recent verification."""
+    key = _token_cache_key(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    rejected = _bad_token_cache.get(key)
+    if rejected is not None:
+        raise InvalidTokenError(rejected)
+
+    try:
+        payload = await _decode_token(token)
+    except InvalidTokenError as exc:
+        _bad_token_cache.set(key, exc.detail)
+        raise
+    exp = payload.get("exp")
+    ttl = TOKEN_CACHE_MAX_TTL_SECONDS if exp is None else min(exp - time.time(), TOKEN_CACHE_MAX_TTL_SECONDS)
+    if ttl > 0:
+        _token_cache.set(key, payload, ttl)
+    return payload
 
 
 # ---------------------------------------------------------------------------
@@ -30,6 +140,8 @@ bearer_scheme = HTTPBearer(auto_error=False)
 class TokenPayload:
     """Convenience wrapper around a decoded JWT payload."""
 
+    __slots__ = ("user_id", "company_id", "role", "token_type")
+
     def __init__(self, payload: dict) -> None:
         self.user_id: str = payload["sub"]
         self.company_id: Optional[str] = payload.get("company_id")
@@ -51,27 +163,36 @@ class TokenPayload:
 
 async def get_current_user(
     request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db),
 ) -> Profile:
     """Decode the bearer token, load the profile, and populate request.state
-    so that the TenantMiddleware can pick it up."""
-    if credentials is None:
+    so that the TenantMiddleware can pick it up.
+
+    The result is memoized on request.state: role guards resolve the user
+    inline, so a route combining several guards (or a guard plus
+    get_current_user) would otherwise repeat the profile/client-id query.
+    """
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        return cached
+
+    raw_token = _bearer_token(request)
+    if raw_token is None:
         logger.warning("missing_credentials", path=request.url.path)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_CHALLENGE,
         )
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = await _decode_token_cached(raw_token)
     except InvalidTokenError as exc:
         logger.warning("token_invalid", detail=str(exc))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(exc),
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_CHALLENGE,
         ) from exc
 
     token = TokenPayload(payload)
@@ -82,10 +203,41 @@ async def get_current_user(
             detail="Refresh tokens cannot be used for API access",
         )
 
-    result = await db.execute(select(Profile).where(Profile.id == token.user_uuid))
-    profile = result.scalar_one_or_none()
+    cached_row = _profile_cache.get(token.user_uuid)
+    if cached_row is not None:
+        values, client_id = cached_row
+        # Reuse the session's own instance if it already holds this profile;
+        # otherwise attach a fresh one as an already-persistent row (no
+        # SELECT), so attribute access and in-place edits work as usual.
+        profile = db.identity_map.get(identity_key(Profile, token.user_uuid))
+        if profile is None:
+            profile = Profile(**values)
+            make_transient_to_detached(profile)
+            db.add(profile)
+    else:
+        # The linked Client id (CLIENT users) rides along as a scalar subquery
+        # so client-portal routes don't need a second round-trip to resolve it.
+        client_id_subq = (
+            select(Client.id)
+            .where(Client.profile_id == Profile.id, Client.company_id == Profile.company_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        # Nothing on the auth path reads profile.company, so skip the selectin
+        # query the relationship would otherwise fire on every request.
+        result = await db.execute(
+            select(Profile, client_id_subq)
+            .options(lazyload(Profile.company))
+            .where(Profile.id == token.user_uuid)
+        )
+        row = result.one_or_none()
+        profile, client_id = row if row is not None else (None, None)
+        if profile is not None:
+            values = {key: getattr(profile, key) for key in _PROFILE_COLUMNS}
+            _profile_cache.set(token.user_uuid, (values, client_id))
 
     if profile is None:
+        invalidate_token(raw_token)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User profile not found",
@@ -101,27 +253,51 @@ async def get_current_user(
     request.state.user_id = profile.id
     request.state.company_id = profile.company_id
     request.state.user_role = profile.role.value if hasattr(profile.role, "value") else profile.role
+    request.state.client_id = client_id
+    request.state.current_user = profile
 
     return profile
 
 
+def requires_auth(dependant) -> bool:
+    """Whether a route's dependency tree authenticates the caller.
+
+    Role and permission guards resolve the user inline rather than through
+    ``Depends(get_current_user)``, so they are recognised by a marker
+    attribute.  Used to document which operations need a bearer token.
+    """
+    call = dependant.call
+    if call is get_current_user or getattr(call, "_authenticates", False):
+        return True
+    return any(requires_auth(sub) for sub in dependant.dependencies)
+
+
 # ---------------------------------------------------------------------------
 # Role-based access helpers
 # ---------------------------------------------------------------------------
 
 def require_roles(*roles: UserRole):
     """Return a dependency that enforces a set of allowed roles."""
+    allowed = [r.value for r in roles]
+    allowed_set = frozenset(allowed)
+    required = f"Required: {allowed}"
 
-    async def _check(current_user: Profile = Depends(get_current_user)) -> Profile:
-        user_role = current_user.role.value if hasattr(current_user.role, "value") else current_user.role
-        allowed = [r.value for r in roles]
-        if user_role not in allowed:
+    async def _check(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+    ) -> Profile:
+        # Resolve the user inline (as require_permission does) so each guarded
+        # route has a single auth node in the dependency graph.
+        current_user = await get_current_user(request, db)
+        user_role = request.state.user_role  # normalized by get_current_user
+        if user_role not in allowed_set:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{user_role}' is not allowed. Required: {allowed}",
+                detail=f"Role '{user_role}' is not allowed. {required}",
             )
         return current_user
 
+    _check._authenticates = True
     return _check
 
 
@@ -132,23 +308,49 @@ get_client_user = require_roles(UserRole.SUPER_ADMIN, UserRole.COMPANY_ADMIN, Us
 get_staff_user = require_roles(UserRole.SUPER_ADMIN, UserRole.COMPANY_ADMIN, UserRole.STAFF)
 
 
+async def get_client_id(
+    request: Request,
+    current_user: Profile = Depends(get_client_user),
+) -> Optional[UUID]:
+    """Return the id of the Client record linked to the authenticated profile.
+
+    Resolved by get_current_user in the same query that loads the profile;
+    ``None`` when the profile has no client record in its company.
+    """
+    return request.state.client_id
+
+
+async def require_client_id(
+    request: Request,
+    current_user: Profile = Depends(get_client_user),
+) -> UUID:
+    """Like get_client_id, but 404 when the profile has no client record.
+
+    Reads request.state directly rather than chaining on get_client_id, so
+    it adds a single node on top of the role guard.
+    """
+    client_id = request.state.client_id
+    if client_id is None:
+        raise HTTPException(status_code=404, detail="Client profile not found")
+    return client_id
+
+
+# Roles that bypass granular staff permission flags.
+_FULL_ACCESS_ROLES = frozenset((UserRole.SUPER_ADMIN.value, UserRole.COMPANY_ADMIN.value))
+
+
 def require_permission(permission: str):
     """Return a dependency that checks a granular permission flag for STAFF users.
     SUPER_ADMIN and COMPANY_ADMIN always pass. STAFF must have the flag set to True."""
 
     async def _check(
         request: Request,
-        credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
         db: AsyncSession = Depends(get_db),
     ) -> Profile:
-        current_user = await get_current_user(request, credentials, db)
-        user_role = (
-            current_user.role.value
-            if hasattr(current_user.role, "value")
-            else current_user.role
-        )
+        current_user = await get_current_user(request, db)
+        user_role = request.state.user_role  # normalized by get_current_user
         # SUPER_ADMIN e COMPANY_ADMIN têm acesso total sem verificar permissões
-        if user_role in (UserRole.SUPER_ADMIN.value, UserRole.COMPANY_ADMIN.value):
+        if user_role in _FULL_ACCESS_ROLES:
             return current_user
         
         # Outros roles (não STAFF) não têm acesso
@@ -172,4 +374,5 @@ def require_permission(permission: str):
             )
         return current_user
 
+    _check._authenticates = True
     return _check
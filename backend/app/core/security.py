@@ -4,10 +4,11 @@
 import json
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -97,13 +98,22 @@ def decode_internal_token(token: str) -> dict:
 # Supabase JWT (ES256)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _supabase_public_key():
+    """Build the ES256 verification key from the project JWK once.
+
+    Passing the raw JWK dict made python-jose re-parse the JSON setting and
+    reconstruct the EC public key on every verification.
+    """
+    return jwk.construct(settings.supabase_jwt_jwk, "ES256")
+
+
 def decode_supabase_token(token: str) -> dict:
     """Decode and validate a Supabase ES256 JWT using the project JWK."""
     try:
-        jwk = settings.supabase_jwt_jwk
         payload = jwt.decode(
             token,
-            jwk,
+            _supabase_public_key(),
             algorithms=["ES256"],
             options={"verify_aud": False},
         )
@@ -134,7 +144,9 @@ def require_role(user_role: str, allowed_roles: list[UserRole]) -> None:
     """Raise if the user role is not in the allowed set."""
     from app.utils.exceptions import InsufficientPermissionsError
 
-    if user_role not in [r.value for r in allowed_roles]:
+    # UserRole is a str enum, so the raw role string hashes and compares equal
+    # to its member; the message list is only built on the failure path.
+    if user_role not in allowed_roles:
         raise InsufficientPermissionsError(
             f"Role '{user_role}' is not allowed. Required: {[r.value for r in allowed_roles]}"
         )
@@ -5,7 +5,7 @@ from typing import Optional
 import uuid
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +19,11 @@ class Client(Base, TenantMixin, TimestampMixin):
 
     __tablename__ = "clients"
 
+    # Paginated listing: company filter + ORDER BY created_at DESC.
+    __table_args__ = (
+        Index("ix_clients_company_created", "company_id", "created_at"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
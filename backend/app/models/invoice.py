@@ -6,7 +6,7 @@ import uuid
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Date, DateTime, Enum as SAEnum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Date, DateTime, Enum as SAEnum, ForeignKey, Index, Integer, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,31 @@ class Invoice(Base, TenantMixin, TimestampMixin):
 
     __tablename__ = "invoices"
 
+    # Per-contract lookups (installment lists, last due date, selectin loads),
+    # the client portal's open invoices per contract and the dashboard's
+    # OVERDUE / PENDING aggregates per company.
+    __table_args__ = (
+        Index("ix_invoices_client_lot_due", "client_lot_id", "due_date"),
+        Index(
+            "ix_invoices_client_lot_open_due",
+            "client_lot_id",
+            "due_date",
+            postgresql_where=text("status IN ('PENDING', 'OVERDUE')"),
+        ),
+        Index(
+            "ix_invoices_company_overdue",
+            "company_id",
+            "due_date",
+            postgresql_where=text("status = 'OVERDUE'"),
+        ),
+        Index(
+            "ix_invoices_company_pending",
+            "company_id",
+            "due_date",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
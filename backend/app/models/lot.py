@@ -31,6 +31,8 @@ class Lot(Base, TenantMixin, TimestampMixin):
             unique=True,
             postgresql_where=text("registration_number IS NOT NULL"),
         ),
+        # Paginated listing: company filter + ORDER BY created_at DESC.
+        Index("ix_lots_company_created", "company_id", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -6,9 +6,9 @@ import uuid
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Boolean, Date, Enum as SAEnum, ForeignKey, Numeric, String, Text
+from sqlalchemy import Boolean, Date, Enum as SAEnum, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, joinedload, lazyload, mapped_column, relationship
 
 from app.core.database import Base
 from app.models.base import TenantMixin, TimestampMixin
@@ -40,6 +40,11 @@ class ServiceOrder(Base, TenantMixin, TimestampMixin):
 
     __tablename__ = "service_orders"
 
+    # Paginated listing: company filter + ORDER BY created_at DESC.
+    __table_args__ = (
+        Index("ix_service_orders_company_created", "company_id", "created_at"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -50,7 +55,10 @@ class ServiceOrder(Base, TenantMixin, TimestampMixin):
         UUID(as_uuid=True), ForeignKey("lots.id", ondelete="SET NULL"), nullable=True
     )
     service_type_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("service_types.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("service_types.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     requested_date: Mapped[date] = mapped_column(Date, nullable=False)
     execution_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -71,3 +79,20 @@ class ServiceOrder(Base, TenantMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<ServiceOrder {self.id} status={self.status.value}>"
+
+
+def service_order_response_load() -> tuple:
+    """Loader options for ServiceOrderResponse.from_order.
+
+    from_order only reads the client's name/CPF and the service type name.
+    Both are many-to-one, so JOIN them into the order SELECT (one round trip,
+    no extra per-relationship queries) and stop the default selectin cascade:
+    the lot would pull its development and every sibling lot, the service
+    type every order of that type. Built on call so mappers configure after
+    all models import.
+    """
+    return (
+        lazyload("*"),
+        joinedload(ServiceOrder.client).lazyload("*"),
+        joinedload(ServiceOrder.service_type).lazyload("*"),
+    )
@@ -13,21 +13,29 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 # Rate conversion helpers (percentage <-> decimal)
 # ---------------------------------------------------------------------------
 
+_HUNDRED = Decimal("100")
+
+
+def _as_decimal(v) -> Decimal:
+    # Numeric columns already load as Decimal; only re-parse other inputs.
+    return v if isinstance(v, Decimal) else Decimal(str(v))
+
+
 def rate_from_percent(v, max_percent: int = 100):
     """Convert a percentage input (e.g. 2 for 2%) to decimal (0.02) for DB storage."""
     if v is None:
         return v
-    d = Decimal(str(v))
+    d = _as_decimal(v)
     if d < 0 or d > max_percent:
         raise ValueError(f"Value must be between 0 and {max_percent}")
-    return d / Decimal("100")
+    return d / _HUNDRED
 
 
 def rate_to_percent(v):
     """Convert a decimal from DB (e.g. 0.02) to percentage (2) for API response."""
     if v is None:
         return v
-    return Decimal(str(v)) * Decimal("100")
+    return _as_decimal(v) * _HUNDRED
 
 
 # ---------------------------------------------------------------------------
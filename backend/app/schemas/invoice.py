@@ -27,3 +27,17 @@ class InvoiceResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_invoice(cls, invoice) -> "InvoiceResponse":
+        """Build the response from an Invoice row without re-validating it.
+
+        Uses model_construct: every field maps 1:1 to an already-typed column,
+        so per-field validation is skipped on the list endpoints.
+        """
+        return cls.model_construct(
+            **{name: getattr(invoice, name) for name in _INVOICE_FIELDS}
+        )
+
+
+_INVOICE_FIELDS = tuple(InvoiceResponse.model_fields)
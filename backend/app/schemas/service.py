@@ -96,13 +96,28 @@ class ServiceOrderResponse(BaseModel):
 
     @classmethod
     def from_order(cls, order) -> "ServiceOrderResponse":
-        """Build the response including the requesting client and service type names."""
-        resp = cls.model_validate(order)
+        """Build the response including the requesting client and service type names.
+
+        Uses model_construct: the ORM row is already typed, so per-field
+        validation is skipped (only a fresh order's int Numeric defaults need
+        coercing to Decimal).
+        """
+        data = {name: getattr(order, name) for name in _ORDER_COLUMN_FIELDS}
+        for key in ("cost", "revenue"):
+            if not isinstance(data[key], Decimal):
+                data[key] = Decimal(data[key] or 0)
         client = getattr(order, "client", None)
         if client is not None:
-            resp.client_name = getattr(client, "full_name", None)
-            resp.client_cpf_cnpj = getattr(client, "cpf_cnpj", None)
+            data["client_name"] = getattr(client, "full_name", None)
+            data["client_cpf_cnpj"] = getattr(client, "cpf_cnpj", None)
         service_type = getattr(order, "service_type", None)
         if service_type is not None:
-            resp.service_type_name = getattr(service_type, "name", None)
-        return resp
+            data["service_type_name"] = getattr(service_type, "name", None)
+        return cls.model_construct(**data)
+
+
+# Fields copied straight from the ServiceOrder row by from_order.
+_ORDER_COLUMN_FIELDS = tuple(
+    name for name in ServiceOrderResponse.model_fields
+    if name not in ("client_name", "client_cpf_cnpj", "service_type_name")
+)
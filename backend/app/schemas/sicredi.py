@@ -12,7 +12,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from app.utils.documents import is_valid_cpf_cnpj
+from app.utils.documents import is_valid_cpf_cnpj, normalize_cpf_cnpj
 
 
 # ---------------------------------------------------------------------------
@@ -103,7 +103,9 @@ class PagadorRequest(BaseModel):
         # Reject invalid CPF/CNPJ up-front so Sicredi doesn't 400 mid-batch.
         if not is_valid_cpf_cnpj(v):
             raise ValueError("CPF/CNPJ do pagador inválido. Informe um documento válido.")
-        return v
+        # Sicredi expects the bare document: digits, or upper-cased
+        # alphanumerics for the new CNPJ.
+        return normalize_cpf_cnpj(v)
 
 
 class BeneficiarioFinalRequest(BaseModel):
@@ -1,12 +1,15 @@
 
 """Authentication service – signup, login, token refresh."""
 
+import asyncio
 from uuid import UUID
 
 from slugify import slugify
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.core.deps import invalidate_profile_cache
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -27,44 +30,42 @@ logger = get_logger(__name__)
 async def signup(data: SignupRequest, db: AsyncSession) -> TokenResponse:
     """Register a new company with its first super_admin user."""
 
-    # Check slug uniqueness
-    existing = await db.execute(select(Company).where(Company.slug == data.company_slug))
-    if existing.scalar_one_or_none():
-        logger.warning("signup_conflict", reason="slug_taken")
-        raise AuthenticationError("Registration failed: duplicate data detected")
-
-    # Check email uniqueness
-    existing_email = await db.execute(select(Profile).where(Profile.email == data.email))
-    if existing_email.scalar_one_or_none():
-        logger.warning("signup_conflict", reason="email_taken")
-        raise AuthenticationError("Registration failed: duplicate data detected")
-
-    # Check CPF/CNPJ uniqueness
-    existing_cpf = await db.execute(select(Profile).where(Profile.cpf_cnpj == data.cpf_cnpj))
-    if existing_cpf.scalar_one_or_none():
-        logger.warning("signup_conflict", reason="cpf_cnpj_taken")
-        raise AuthenticationError("Registration failed: duplicate data detected")
-
-    # Create company
+    # Slug / email / CPF-CNPJ uniqueness in one round-trip (EXISTS probes,
+    # no row or relationship loading).
+    slug_taken, email_taken, cpf_taken = (await db.execute(
+        select(
+            exists().where(Company.slug == data.company_slug),
+            exists().where(Profile.email == data.email),
+            exists().where(Profile.cpf_cnpj == data.cpf_cnpj),
+        )
+    )).one()
+    for taken, reason in (
+        (slug_taken, "slug_taken"),
+        (email_taken, "email_taken"),
+        (cpf_taken, "cpf_cnpj_taken"),
+    ):
+        if taken:
+            logger.warning("signup_conflict", reason=reason)
+            raise AuthenticationError("Registration failed: duplicate data detected")
+
+    # Company + first profile are flushed together: linking through the
+    # relationship lets the unit of work order both INSERTs in one flush, and
+    # a failure rolls both back with the session transaction.
     company = Company(
         name=data.company_name,
         slug=data.company_slug,
         status=CompanyStatus.ACTIVE,
     )
-    db.add(company)
-    await db.flush()
-
-    # Create profile
     profile = Profile(
-        company_id=company.id,
+        company=company,
         role=UserRole.SUPER_ADMIN,
         full_name=data.full_name,
         email=data.email,
         cpf_cnpj=data.cpf_cnpj,
         phone=data.phone,
-        hashed_password=hash_password(data.password),
+        hashed_password=await asyncio.to_thread(hash_password, data.password),
     )
-    db.add(profile)
+    db.add_all([company, profile])
     await db.flush()
 
     logger.info("signup_success", user_id=str(profile.id), company_id=str(company.id))
@@ -84,9 +85,17 @@ async def signup(data: SignupRequest, db: AsyncSession) -> TokenResponse:
 
 
 async def login(data: LoginRequest, db: AsyncSession) -> TokenResponse:
-    """Authenticate a user with email + password."""
+    """Authenticate a user with email + password.
+
+    bcrypt hashing/verification is deliberately slow CPU work, so it runs in a
+    worker thread rather than stalling every other request on the event loop.
+    """
+    # Only the profile columns feed the tokens; without lazyload the selectin
+    # cascade would pull the company and every one of its profiles.
     result = await db.execute(
-        select(Profile).where(Profile.email == data.email, Profile.is_active == True)
+        select(Profile)
+        .options(lazyload("*"))
+        .where(Profile.email == data.email, Profile.is_active == True)
     )
     profiles = result.scalars().all()
 
@@ -96,7 +105,9 @@ async def login(data: LoginRequest, db: AsyncSession) -> TokenResponse:
 
     profile = None
     for p in profiles:
-        if p.hashed_password and verify_password(data.password, p.hashed_password):
+        if p.hashed_password and await asyncio.to_thread(
+            verify_password, data.password, p.hashed_password
+        ):
             profile = p
             break
 
@@ -131,7 +142,9 @@ async def refresh_tokens(refresh_token: str, db: AsyncSession) -> TokenResponse:
         raise AuthenticationError("Token is not a refresh token")
 
     user_id = payload["sub"]
-    result = await db.execute(select(Profile).where(Profile.id == UUID(user_id)))
+    result = await db.execute(
+        select(Profile).options(lazyload("*")).where(Profile.id == UUID(user_id))
+    )
     profile = result.scalar_one_or_none()
 
     if profile is None:
@@ -211,16 +224,22 @@ async def reset_password(token: str, new_password: str, db: AsyncSession) -> Non
     if not user_id:
         raise AuthenticationError("Invalid token: missing user ID")
 
-    result = await db.execute(select(Profile).where(Profile.id == UUID(user_id)))
+    result = await db.execute(
+        select(Profile)
+        .options(lazyload("*"))
+        .where(Profile.id == UUID(user_id))
+        .execution_options(populate_existing=True)
+    )
     profile = result.scalar_one_or_none()
 
     if profile is None:
         raise ResourceNotFoundError("User")
 
     # Update password
-    profile.hashed_password = hash_password(new_password)
+    profile.hashed_password = await asyncio.to_thread(hash_password, new_password)
     db.add(profile)
     await db.flush()
+    invalidate_profile_cache(db, profile.id)
 
     logger.info("password_reset_success", user_id=str(profile.id))
 
@@ -232,7 +251,13 @@ async def change_password(
     db: AsyncSession,
 ) -> None:
     """Change password for logged-in user (requires current password)."""
-    result = await db.execute(select(Profile).where(Profile.id == user_id))
+    # populate_existing: the session may already hold the profile built by
+    # get_current_user from the auth cache; verify against the stored hash.
+    result = await db.execute(
+        select(Profile)
+        .where(Profile.id == user_id)
+        .execution_options(populate_existing=True)
+    )
     profile = result.scalar_one_or_none()
 
     if profile is None:
@@ -241,13 +266,14 @@ async def change_password(
     if profile.hashed_password is None:
         raise AuthenticationError("No password set for this account")
 
-    if not verify_password(current_password, profile.hashed_password):
+    if not await asyncio.to_thread(verify_password, current_password, profile.hashed_password):
         logger.warning("change_password_wrong_current", user_id=str(user_id))
         raise AuthenticationError("Current password is incorrect")
 
     # Update password
-    profile.hashed_password = hash_password(new_password)
+    profile.hashed_password = await asyncio.to_thread(hash_password, new_password)
     db.add(profile)
     await db.flush()
+    invalidate_profile_cache(db, profile.id)
 
     logger.info("password_change_success", user_id=str(user_id))
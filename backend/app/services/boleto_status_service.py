@@ -16,6 +16,7 @@ from zoneinfo import ZoneInfo
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.models.boleto import Boleto
 from app.models.enums import BoletoStatus, InvoiceStatus
@@ -96,7 +97,9 @@ async def mark_boleto_liquidado(
 
     if boleto.invoice_id:
         inv = (
-            await db.execute(select(Invoice).where(Invoice.id == boleto.invoice_id))
+            await db.execute(
+                select(Invoice).options(lazyload("*")).where(Invoice.id == boleto.invoice_id)
+            )
         ).scalar_one_or_none()
         if inv and inv.status != InvoiceStatus.PAID:
             inv.status = InvoiceStatus.PAID
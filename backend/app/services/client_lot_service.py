@@ -1,6 +1,7 @@
 """ClientLot service for managing client-lot relationships and installment tracking."""
 
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
@@ -161,9 +162,11 @@ async def should_generate_next_batch(
     if info.remaining_installments < 12:
         return False, f"Only {info.remaining_installments} installments remaining"
 
-    # Check if there's a recent invoice due date to compare against
+    # Check if there's a recent invoice due date to compare against.
+    # Only the date is needed, so don't hydrate the Invoice (and its
+    # selectin relationships).
     next_due_stmt = (
-        select(Invoice)
+        select(Invoice.due_date)
         .where(
             Invoice.client_lot_id == client_lot_id,
             Invoice.status == InvoiceStatus.PENDING,
@@ -172,12 +175,10 @@ async def should_generate_next_batch(
         .limit(1)
     )
     next_result = await db.execute(next_due_stmt)
-    next_invoice = next_result.scalar_one_or_none()
+    next_due = next_result.scalar_one_or_none()
 
-    if next_invoice:
-        from datetime import date, timedelta
-
-        days_until_due = (next_invoice.due_date - date.today()).days
+    if next_due:
+        days_until_due = (next_due - date.today()).days
         if days_until_due > days_threshold:
             return False, f"Next due date is {days_until_due} days away (threshold: {days_threshold})"
 
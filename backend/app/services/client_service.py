@@ -2,6 +2,7 @@ from typing import Optional
 
 """Client business-logic service."""
 
+import asyncio
 import math
 from uuid import UUID
 
@@ -9,7 +10,9 @@ from fastapi import HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from app.core.deps import invalidate_profile_cache
 from app.core.security import hash_password
 from app.core.tenant import get_tenant_filter
 from app.models.client import Client
@@ -25,9 +28,14 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Postgres expression that strips any non-digit from a stored CPF/CNPJ, so the
-# uniqueness check matches regardless of how legacy rows were formatted.
+# Postgres expressions that strip formatting from a stored CPF/CNPJ, so the
+# uniqueness check matches regardless of how legacy rows were formatted:
+# digits only, or upper-cased digits and letters for alphanumeric CNPJs.
 _CPF_DIGITS = func.regexp_replace(Client.cpf_cnpj, r"\D", "", "g")
+_CNPJ_CHARS = func.upper(func.regexp_replace(Client.cpf_cnpj, r"[^0-9A-Za-z]", "", "g"))
+
+# Listing pages leave out the JSONB documents blob; get_client returns it.
+_LIST_COLUMNS = tuple(c for c in Client.__table__.c if c.key != "documents")
 
 
 async def find_client_by_cpf(
@@ -38,16 +46,17 @@ async def find_client_by_cpf(
 ) -> Optional[Client]:
     """Return an existing client in this company with the same CPF/CNPJ.
 
-    Comparison is done on digits only, so "123.456.789-00" and "12345678900"
-    are recognised as the same document. Returns None when the CPF is empty
-    or no match exists.
+    Comparison is done on the normalized form, so "123.456.789-00" and
+    "12345678900" are recognised as the same document. Returns None when the
+    CPF is empty or no match exists.
     """
-    digits = normalize_cpf_cnpj(cpf_cnpj)
-    if not digits:
+    key = normalize_cpf_cnpj(cpf_cnpj)
+    if not key:
         return None
+    stored = _CPF_DIGITS if key.isdigit() else _CNPJ_CHARS
     query = select(Client).where(
         Client.company_id == company_id,
-        _CPF_DIGITS == digits,
+        stored == key,
     )
     if exclude_id is not None:
         query = query.where(Client.id != exclude_id)
@@ -92,11 +101,14 @@ async def list_clients(
     total = (await db.execute(count_q)).scalar() or 0
 
     rows = await db.execute(
-        base.order_by(Client.created_at.desc())
+        base.with_only_columns(*_LIST_COLUMNS)
+        .order_by(Client.created_at.desc())
         .offset(params.offset)
         .limit(params.per_page)
     )
-    items = [ClientResponse.model_validate(r) for r in rows.scalars().all()]
+    # Rows come straight from typed columns, so skip per-field validation;
+    # documents (not selected) falls back to its None default.
+    items = [ClientResponse.model_construct(**r._mapping) for r in rows.all()]
 
     return PaginatedResponse[ClientResponse](
         items=items,
@@ -146,7 +158,8 @@ async def create_client(
             email=data.email,
             cpf_cnpj=data.cpf_cnpj,
             phone=data.phone,
-            hashed_password=hash_password(data.password),
+            # bcrypt is CPU-bound; keep it off the event loop.
+            hashed_password=await asyncio.to_thread(hash_password, data.password),
         )
         db.add(profile)
         try:
@@ -221,7 +234,16 @@ async def update_client(
     db: AsyncSession, company_id: UUID, client_id: UUID, data: ClientUpdate
 ) -> Client:
     """Partial update of client data."""
-    client = await get_client(db, company_id, client_id)
+    # ClientResponse only reads columns, so skip the selectin cascade
+    # (profile, creator, client_lots -> invoices, boletos) a plain get_client
+    # would fire: one SELECT plus the UPDATE on flush.
+    client = (await db.execute(
+        select(Client)
+        .options(lazyload("*"))
+        .where(Client.id == client_id, Client.company_id == company_id)
+    )).scalar_one_or_none()
+    if client is None:
+        raise ResourceNotFoundError("Client")
     update_data = data.model_dump(exclude_unset=True)
 
     # Trava de duplicidade ao trocar o CPF/CNPJ para um já usado por outro cliente.
@@ -260,8 +282,15 @@ async def deactivate_client(db: AsyncSession, company_id: UUID, client_id: UUID)
     )).scalars().all()
     for cl in active_lots:
         cl.status = ClientLotStatus.CANCELLED
-        lot = (await db.execute(select(Lot).where(Lot.id == cl.lot_id))).scalar_one_or_none()
-        if lot is not None and lot.status != LotStatus.AVAILABLE:
+    # One IN query for every released lot instead of a SELECT per contract.
+    lot_ids = {cl.lot_id for cl in active_lots}
+    if lot_ids:
+        lots = (await db.execute(
+            select(Lot).options(lazyload("*")).where(
+                Lot.id.in_(lot_ids), Lot.status != LotStatus.AVAILABLE
+            )
+        )).scalars().all()
+        for lot in lots:
             lot.status = LotStatus.AVAILABLE
 
     # Remove the portal account tied to this client (frees the unique email/CPF).
@@ -273,6 +302,7 @@ async def deactivate_client(db: AsyncSession, company_id: UUID, client_id: UUID)
             client.profile_id = None  # FK is SET NULL; clear before delete
             await db.flush()
             await db.delete(profile)
+            invalidate_profile_cache(db, profile.id)
 
     await db.flush()
     logger.info(
@@ -9,10 +9,9 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-
-def _init_resend() -> None:
-    """Configure the Resend SDK."""
-    resend.api_key = settings.RESEND_API_KEY
+# The Resend SDK reads its key from module state; set it once at import
+# instead of re-assigning it on every send.
+resend.api_key = settings.RESEND_API_KEY
 
 
 async def send_email(
@@ -23,7 +22,6 @@ async def send_email(
     from_name: Optional[str] = None,
 ) -> Optional[dict]:
     """Send an email via Resend.  Returns the API response dict or None on failure."""
-    _init_resend()
     sender = f"{from_name or settings.SMTP_FROM_NAME} <{from_email or settings.SMTP_FROM_EMAIL}>"
 
     try:
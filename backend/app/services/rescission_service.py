@@ -28,6 +28,24 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+async def _invoice_totals(db: AsyncSession, client_lot_id: UUID) -> tuple[Decimal, Decimal]:
+    """Return (total_paid, total_debt) for a contract, summed in the database."""
+    row = await db.execute(
+        select(
+            func.coalesce(
+                func.sum(Invoice.amount).filter(Invoice.status == InvoiceStatus.PAID), 0
+            ),
+            func.coalesce(
+                func.sum(Invoice.amount).filter(
+                    Invoice.status.in_((InvoiceStatus.PENDING, InvoiceStatus.OVERDUE))
+                ),
+                0,
+            ),
+        ).where(Invoice.client_lot_id == client_lot_id)
+    )
+    return row.one()
+
+
 async def create_rescission(
     db: AsyncSession,
     company_id: UUID,
@@ -55,13 +73,7 @@ async def create_rescission(
         raise ValueError(f"Client lot already in status {client_lot.status.value}")
 
     # Calculate paid and debt amounts
-    inv_rows = await db.execute(
-        select(Invoice).where(Invoice.client_lot_id == client_lot_id)
-    )
-    invoices = list(inv_rows.scalars().all())
-
-    total_paid = sum(inv.amount for inv in invoices if inv.status == InvoiceStatus.PAID)
-    total_debt = sum(inv.amount for inv in invoices if inv.status in (InvoiceStatus.PENDING, InvoiceStatus.OVERDUE))
+    total_paid, total_debt = await _invoice_totals(db, client_lot_id)
 
     rescission = Rescission(
         company_id=company_id,
@@ -141,15 +153,7 @@ async def trigger_automatic_rescission(
     if existing.scalar_one_or_none():
         return None
 
-    inv_rows = await db.execute(
-        select(Invoice).where(Invoice.client_lot_id == client_lot_id)
-    )
-    invoices = list(inv_rows.scalars().all())
-    total_paid = sum((inv.amount for inv in invoices if inv.status == InvoiceStatus.PAID), Decimal("0"))
-    total_debt = sum(
-        (inv.amount for inv in invoices if inv.status in (InvoiceStatus.PENDING, InvoiceStatus.OVERDUE)),
-        Decimal("0"),
-    )
+    total_paid, total_debt = await _invoice_totals(db, client_lot_id)
 
     rescission = Rescission(
         company_id=company_id,
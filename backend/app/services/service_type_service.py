@@ -0,0 +1,42 @@
+"""Service type catalogue lookups shared by the admin and client routers."""
+
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from app.models.service import ServiceType
+from app.schemas.service import ServiceTypeResponse
+from app.utils.cache import TTLCache, pop_after_commit
+
+# The active catalogue of a company changes only when an admin edits it, but
+# every client portal visit lists it. Writes on this worker evict the entry
+# when they commit; other workers pick the change up once the TTL lapses.
+ACTIVE_TYPES_CACHE_TTL_SECONDS = 60
+_active_types_cache = TTLCache(maxsize=256, ttl=ACTIVE_TYPES_CACHE_TTL_SECONDS)
+
+
+async def list_active_service_types(
+    db: AsyncSession, company_id: UUID
+) -> list[ServiceTypeResponse]:
+    """Return the company's active service types (cached per worker)."""
+    types = _active_types_cache.get(company_id)
+    if types is None:
+        # lazyload: the response has no use for each type's selectin `orders`.
+        rows = await db.execute(
+            select(ServiceType)
+            .options(lazyload("*"))
+            .where(
+                ServiceType.company_id == company_id,
+                ServiceType.is_active.is_(True),
+            )
+        )
+        types = [ServiceTypeResponse.model_validate(s) for s in rows.scalars().all()]
+        _active_types_cache.set(company_id, types)
+    return types
+
+
+def invalidate_service_types_cache(db: AsyncSession, company_id: UUID) -> None:
+    """Drop the cached catalogue once *db* commits a service type change."""
+    pop_after_commit(db, _active_types_cache, company_id)
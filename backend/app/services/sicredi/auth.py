@@ -20,6 +20,7 @@ from app.services.sicredi.config import (
 )
 from app.services.sicredi.exceptions import SicrediAuthError, SicrediTimeoutError
 from app.services.sicredi.schemas import SicrediTokenResponse
+from app.utils.http import get_http_client
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -93,8 +94,9 @@ class SicrediAuth:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                resp = await client.post(self._creds.auth_url, headers=headers, data=data)
+            resp = await get_http_client().post(
+                self._creds.auth_url, headers=headers, data=data, timeout=HTTP_TIMEOUT
+            )
         except httpx.TimeoutException as exc:
             raise SicrediTimeoutError(detail=f"Auth request timed out: {exc}")
 
@@ -125,8 +127,9 @@ class SicrediAuth:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                resp = await client.post(self._creds.auth_url, headers=headers, data=data)
+            resp = await get_http_client().post(
+                self._creds.auth_url, headers=headers, data=data, timeout=HTTP_TIMEOUT
+            )
         except httpx.TimeoutException as exc:
             raise SicrediTimeoutError(detail=f"Refresh request timed out: {exc}")
 
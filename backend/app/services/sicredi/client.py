@@ -15,6 +15,7 @@ from typing import Any, Optional
 from uuid import UUID
 
 import httpx
+import orjson
 
 from app.services.sicredi.audit_recorder import record_call
 from app.services.sicredi.auth import SicrediAuth
@@ -29,6 +30,7 @@ from app.services.sicredi.exceptions import (
     SicrediValidationError,
 )
 from app.services.sicredi.webhooks import SicrediWebhooks
+from app.utils.http import get_http_client
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -115,15 +117,17 @@ class SicrediClient:
             headers["Content-Type"] = "application/x-www-form-urlencoded"
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as http:
-                resp = await http.request(
-                    method=method,
-                    url=url,
-                    json=json,
-                    params=params,
-                    data=data,
-                    headers=headers,
-                )
+            # Bodies are encoded with orjson; headers already carry the
+            # application/json content type for non-form requests.
+            resp = await get_http_client().request(
+                method=method,
+                url=url,
+                content=orjson.dumps(json) if json is not None else None,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+            )
         except httpx.TimeoutException as exc:
             record_call(
                 company_id=self.company_id,
@@ -155,6 +159,8 @@ class SicrediClient:
                 expect_binary=expect_binary,
             )
 
+        # Parsed once: the same body feeds the audit record and the result.
+        body = None if expect_binary else self._safe_body(resp)
         record_call(
             company_id=self.company_id,
             method=method,
@@ -162,7 +168,7 @@ class SicrediClient:
             status_code=resp.status_code,
             success=resp.status_code in (200, 201, 202),
             request_payload=json or data or params,
-            response_payload={"binary_bytes": len(resp.content)} if expect_binary else self._safe_body(resp),
+            response_payload={"binary_bytes": len(resp.content)} if expect_binary else body,
         )
 
         # Success — 202 Accepted is returned for async commands like baixa
@@ -170,10 +176,7 @@ class SicrediClient:
         if resp.status_code in (200, 201, 202):
             if expect_binary:
                 return resp.content
-            try:
-                return resp.json()
-            except Exception:
-                return resp.text
+            return body
 
         # Error handling
         self._raise_for_status(resp, url)
@@ -200,6 +203,6 @@ class SicrediClient:
     def _safe_body(resp: httpx.Response) -> Any:
         """Attempt to parse response body as JSON."""
         try:
-            return resp.json()
+            return orjson.loads(resp.content)
         except Exception:
             return resp.text
@@ -1,5 +1,6 @@
 """Staff account management service."""
 
+import asyncio
 import uuid
 from typing import List
 
@@ -7,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.deps import invalidate_profile_cache
 from app.core.security import hash_password
 from app.models.enums import UserRole
 from app.models.staff_permission import StaffPermission
@@ -33,6 +35,8 @@ async def _get_staff_in_company(
             Profile.company_id == company_id,
             Profile.role == UserRole.STAFF,
         )
+        # Edits start from the stored row, not an auth-cache-built instance.
+        .execution_options(populate_existing=True)
     )
     profile = result.scalar_one_or_none()
     if profile is None:
@@ -76,7 +80,7 @@ async def create_staff(
         email=data.email,
         cpf_cnpj=data.cpf_cnpj,
         phone=data.phone,
-        hashed_password=hash_password(data.password),
+        hashed_password=await asyncio.to_thread(hash_password, data.password),
         is_active=True,
     )
     db.add(profile)
@@ -115,7 +119,7 @@ async def update_staff(
     if data.phone is not None:
         profile.phone = data.phone
     if data.password is not None:
-        profile.hashed_password = hash_password(data.password)
+        profile.hashed_password = await asyncio.to_thread(hash_password, data.password)
 
     db.add(profile)
 
@@ -137,7 +141,8 @@ async def update_staff(
             db.add(perm)
 
     await db.flush()
-    
+    invalidate_profile_cache(db, staff_id)
+
     # Recarregar profile com staff_permission
     result = await db.execute(
         select(Profile)
@@ -156,6 +161,7 @@ async def toggle_active(
     profile.is_active = not profile.is_active
     db.add(profile)
     await db.flush()
+    invalidate_profile_cache(db, staff_id)
     await db.refresh(profile)
     action = "activated" if profile.is_active else "deactivated"
     logger.info(f"staff_{action}", staff_id=str(staff_id), company_id=str(company_id))
@@ -168,4 +174,5 @@ async def delete_staff(
     profile = await _get_staff_in_company(staff_id, company_id, db)
     await db.delete(profile)
     await db.flush()
+    invalidate_profile_cache(db, staff_id)
     logger.info("staff_deleted", staff_id=str(staff_id), company_id=str(company_id))
@@ -1,9 +1,12 @@
 
 """Supabase Storage service for file upload / download / delete."""
 
+import asyncio
+import threading
 import uuid as uuid_mod
 from pathlib import PurePosixPath
 
+from fastapi import UploadFile
 from supabase import create_client
 
 from app.core.config import settings
@@ -20,26 +23,78 @@ ALLOWED_EXTENSIONS = {
 MAX_FILE_SIZE_BYTES = 100 * 1024 * 1024  # 100 MB
 
 
-def _get_supabase():
-    """Create a Supabase client using the secret key (server-side)."""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SECRET_KEY)
-
+# Built once per process and shared.  Storage calls run in worker threads
+# (asyncio.to_thread), so construction is guarded: two threads racing on a
+# cold start would otherwise each build a client.
+_supabase = None
+_storage_bucket = None
+_client_lock = threading.Lock()
 
-def _sanitize_filename(original: str) -> str:
-    """Generate a safe unique filename preserving the extension."""
-    ext = PurePosixPath(original).suffix.lower().lstrip(".")
-    if ext not in ALLOWED_EXTENSIONS:
-        raise StorageError(f"File type '.{ext}' is not allowed. Allowed: {ALLOWED_EXTENSIONS}")
-    return f"{uuid_mod.uuid4().hex}.{ext}"
 
+def _get_supabase():
+    """Return the process-wide Supabase client (secret key, server-side).
 
-def validate_file(filename: str, size: int) -> None:
-    """Validate file type and size before upload."""
+    Built once so its underlying HTTP connection pool is reused: a fresh
+    client per call paid a new TCP + TLS handshake for every storage
+    operation, including each signed URL in a listing.
+    """
+    global _supabase
+    if _supabase is None:
+        with _client_lock:
+            if _supabase is None:
+                _supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_SECRET_KEY)
+    return _supabase
+
+
+def _bucket():
+    """Return the storage bucket proxy, built once on the shared client."""
+    global _storage_bucket
+    if _storage_bucket is None:
+        client = _get_supabase()
+        with _client_lock:
+            if _storage_bucket is None:
+                _storage_bucket = client.storage.from_(settings.SUPABASE_STORAGE_BUCKET)
+    return _storage_bucket
+
+
+def validate_file(filename: str, size: int) -> str:
+    """Validate file type and size before upload; returns the extension."""
     ext = PurePosixPath(filename).suffix.lower().lstrip(".")
     if ext not in ALLOWED_EXTENSIONS:
         raise StorageError(f"File type '.{ext}' not allowed. Allowed: {ALLOWED_EXTENSIONS}")
     if size > MAX_FILE_SIZE_BYTES:
         raise StorageError(f"File exceeds maximum size of {MAX_FILE_SIZE_BYTES // (1024*1024)} MB")
+    return ext
+
+
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+def _too_large(max_size: int) -> StorageError:
+    return StorageError(f"File exceeds maximum size of {max_size // (1024*1024)} MB")
+
+
+async def read_upload(file: UploadFile, max_size: int = MAX_FILE_SIZE_BYTES) -> bytes:
+    """Read an uploaded file, refusing it as soon as it exceeds *max_size*.
+
+    Reading the whole body first and checking ``len()`` afterwards buffered
+    oversized uploads in full before rejecting them.  The declared multipart
+    size is checked up front; if it is unknown the body is read in chunks and
+    abandoned once the running total passes the limit.
+    """
+    if file.size is not None:
+        if file.size > max_size:
+            raise _too_large(max_size)
+        return await file.read()
+
+    chunks: list[bytes] = []
+    total = 0
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > max_size:
+            raise _too_large(max_size)
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 async def upload_file(
@@ -53,13 +108,17 @@ async def upload_file(
     File is stored under:
       {bucket}/companies/{company_id}/{subfolder}/{unique_name}
     """
-    validate_file(original_filename, len(file_bytes))
-    safe_name = _sanitize_filename(original_filename)
+    ext = validate_file(original_filename, len(file_bytes))
+    # A random name with the validated extension; the client's filename is
+    # never part of the storage path.
+    safe_name = f"{uuid_mod.uuid4().hex}.{ext}"
     storage_path = f"companies/{company_id}/{subfolder}/{safe_name}"
 
+    # supabase-py is synchronous: run the HTTP round trip in a worker thread
+    # so the event loop keeps serving other requests meanwhile.
     try:
-        supabase = _get_supabase()
-        supabase.storage.from_(settings.SUPABASE_STORAGE_BUCKET).upload(
+        await asyncio.to_thread(
+            _bucket().upload,
             path=storage_path,
             file=file_bytes,
             file_options={"content-type": "application/octet-stream"},
@@ -72,11 +131,9 @@ async def upload_file(
     return storage_path
 
 
-def get_public_url(storage_path: str, expires_in: int = 3600) -> str:
-    """Return a signed URL for an uploaded file (expires in 1 hour by default)."""
+def _sign_url(storage_path: str, expires_in: int) -> str:
     try:
-        supabase = _get_supabase()
-        data = supabase.storage.from_(settings.SUPABASE_STORAGE_BUCKET).create_signed_url(
+        data = _bucket().create_signed_url(
             storage_path, expires_in
         )
         if isinstance(data, dict) and "signedURL" in data:
@@ -86,18 +143,70 @@ def get_public_url(storage_path: str, expires_in: int = 3600) -> str:
         raise StorageError(f"Failed to get URL: {exc}") from exc
 
 
+def _sign_urls(storage_paths: list[str], expires_in: int) -> dict[str, str | None]:
+    try:
+        data = _bucket().create_signed_urls(
+            storage_paths, expires_in
+        )
+        return {item.get("path"): item.get("signedURL") for item in data}
+    except Exception as exc:
+        logger.warning("storage_batch_sign_failed", count=len(storage_paths), error=str(exc))
+
+    urls: dict[str, str | None] = {}
+    for path in storage_paths:
+        try:
+            urls[path] = _sign_url(path, expires_in)
+        except Exception:
+            urls[path] = None
+    return urls
+
+
+async def get_public_url(storage_path: str, expires_in: int = 3600) -> str:
+    """Return a signed URL for an uploaded file (expires in 1 hour by default)."""
+    # The Storage client is synchronous; sign in a worker thread so the
+    # HTTP round trip doesn't block the event loop.
+    return await asyncio.to_thread(_sign_url, storage_path, expires_in)
+
+
+async def get_signed_urls(storage_paths: list[str], expires_in: int = 3600) -> dict[str, str | None]:
+    """Sign several files in one Storage request; returns ``{path: url}``.
+
+    Falls back to one request per path if the batch call fails, so a single
+    bad path doesn't blank every URL in the response.
+    """
+    if not storage_paths:
+        return {}
+    return await asyncio.to_thread(_sign_urls, storage_paths, expires_in)
+
+
 async def delete_file(storage_path: str) -> None:
     """Delete a file from Supabase Storage."""
     try:
-        supabase = _get_supabase()
-        supabase.storage.from_(settings.SUPABASE_STORAGE_BUCKET).remove([storage_path])
+        await asyncio.to_thread(_bucket().remove, [storage_path])
         logger.info("storage_deleted", path=storage_path)
     except Exception as exc:
         logger.error("storage_delete_failed", path=storage_path, error=str(exc))
         raise StorageError(f"Delete failed: {exc}") from exc
 
 
-def enrich_photos(photos: list | None, only_visible: bool = False) -> list[dict]:
+def _visible_photos(photos: list | None, only_visible: bool) -> list[dict]:
+    return [
+        p for p in photos or []
+        if not only_visible or p.get("visible_to_client")
+    ]
+
+
+def _with_urls(photos: list[dict], urls: dict[str, str | None]) -> list[dict]:
+    out: list[dict] = []
+    for p in photos:
+        item = dict(p)
+        item["url"] = urls.get(p.get("path"))
+        out.append(item)
+    out.sort(key=lambda x: (not x.get("is_primary", False)))
+    return out
+
+
+async def enrich_photos(photos: list | None, only_visible: bool = False) -> list[dict]:
     """Return gallery photos with a fresh signed ``url`` for each item.
 
     Photos are stored as ``{id, path, is_primary, visible_to_client, caption}``.
@@ -109,27 +218,27 @@ def enrich_photos(photos: list | None, only_visible: bool = False) -> list[dict]
         only_visible: when True, drop photos not marked ``visible_to_client``
             (used for client-portal responses).
     """
-    out: list[dict] = []
-    for p in photos or []:
-        if only_visible and not p.get("visible_to_client"):
-            continue
-        item = dict(p)
-        path = p.get("path")
-        try:
-            item["url"] = get_public_url(path) if path else None
-        except Exception:
-            item["url"] = None
-        out.append(item)
-    out.sort(key=lambda x: (not x.get("is_primary", False)))
-    return out
+    return (await enrich_photo_lists([photos], only_visible))[0]
+
+
+async def enrich_photo_lists(galleries: list[list | None], only_visible: bool = False) -> list[list[dict]]:
+    """:func:`enrich_photos` for several galleries, e.g. one per row of a page.
+
+    Every path on the page is signed in a single Storage request instead of
+    one request per gallery.
+    """
+    selected = [_visible_photos(photos, only_visible) for photos in galleries]
+    urls = await get_signed_urls(
+        [p["path"] for photos in selected for p in photos if p.get("path")]
+    )
+    return [_with_urls(photos, urls) for photos in selected]
 
 
 async def list_files(company_id: str, subfolder: str = "documents") -> list[dict]:
     """List files in a company's subfolder."""
     prefix = f"companies/{company_id}/{subfolder}"
     try:
-        supabase = _get_supabase()
-        files = supabase.storage.from_(settings.SUPABASE_STORAGE_BUCKET).list(prefix)
+        files = await asyncio.to_thread(_bucket().list, prefix)
         return files
     except Exception as exc:
         raise StorageError(f"List failed: {exc}") from exc
@@ -1,5 +1,6 @@
 """Superadmin management service – create additional superadmins for same company."""
 
+import asyncio
 import uuid
 
 from sqlalchemy import select
@@ -42,7 +43,7 @@ async def create_superadmin(
         email=data.email,
         cpf_cnpj=data.cpf_cnpj,
         phone=data.phone,
-        hashed_password=hash_password(data.password),
+        hashed_password=await asyncio.to_thread(hash_password, data.password),
     )
     db.add(profile)
     await db.flush()
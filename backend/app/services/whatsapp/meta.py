@@ -10,17 +10,15 @@ Auth: Bearer token in Authorization header.
 
 from typing import Any, Optional
 
-import httpx
-
 from app.services.whatsapp.base import WhatsAppProviderBase
 from app.services.whatsapp.schemas import ConnectionStatus, SendResult, TemplateInfo
+from app.utils.http import get_http_client
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 GRAPH_API_VERSION = "v21.0"
 GRAPH_BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
-DEFAULT_TIMEOUT = 30.0
 
 
 class MetaCloudProvider(WhatsAppProviderBase):
@@ -91,30 +89,30 @@ class MetaCloudProvider(WhatsAppProviderBase):
         """Internal: POST to /{phone_number_id}/messages."""
         url = f"{GRAPH_BASE_URL}/{self._phone_number_id}/messages"
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(url, json=payload, headers=self._headers())
-                data = resp.json()
-
-                if resp.status_code in (200, 201):
-                    messages = data.get("messages", [])
-                    msg_id = messages[0].get("id") if messages else None
-                    logger.info("meta_message_sent", to=to, message_id=msg_id)
-                    return SendResult(
-                        success=True,
-                        message_id=msg_id,
-                        provider=self.provider_name,
-                        raw_response=data,
-                    )
-
-                error_data = data.get("error", {})
-                error_msg = error_data.get("message", f"HTTP {resp.status_code}")
-                logger.error("meta_send_failed", to=to, status=resp.status_code, error=error_msg)
+            client = get_http_client()
+            resp = await client.post(url, json=payload, headers=self._headers())
+            data = resp.json()
+
+            if resp.status_code in (200, 201):
+                messages = data.get("messages", [])
+                msg_id = messages[0].get("id") if messages else None
+                logger.info("meta_message_sent", to=to, message_id=msg_id)
                 return SendResult(
-                    success=False,
+                    success=True,
+                    message_id=msg_id,
                     provider=self.provider_name,
-                    error=error_msg,
                     raw_response=data,
                 )
+
+            error_data = data.get("error", {})
+            error_msg = error_data.get("message", f"HTTP {resp.status_code}")
+            logger.error("meta_send_failed", to=to, status=resp.status_code, error=error_msg)
+            return SendResult(
+                success=False,
+                provider=self.provider_name,
+                error=error_msg,
+                raw_response=data,
+            )
         except Exception as exc:
             logger.error("meta_send_exception", to=to, error=str(exc))
             return SendResult(success=False, provider=self.provider_name, error=str(exc))
@@ -128,26 +126,26 @@ class MetaCloudProvider(WhatsAppProviderBase):
         url = f"{GRAPH_BASE_URL}/{self._phone_number_id}"
         params = {"fields": "verified_name,display_phone_number,quality_rating,platform_type"}
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.get(url, params=params, headers=self._headers())
-                data = resp.json()
-
-                if resp.status_code == 200:
-                    return ConnectionStatus(
-                        connected=True,
-                        status="connected",
-                        profile_name=data.get("verified_name"),
-                        phone_number=data.get("display_phone_number"),
-                        raw=data,
-                    )
-
-                error_data = data.get("error", {})
+            client = get_http_client()
+            resp = await client.get(url, params=params, headers=self._headers())
+            data = resp.json()
+
+            if resp.status_code == 200:
                 return ConnectionStatus(
-                    connected=False,
-                    status="disconnected",
-                    error=error_data.get("message", f"HTTP {resp.status_code}"),
+                    connected=True,
+                    status="connected",
+                    profile_name=data.get("verified_name"),
+                    phone_number=data.get("display_phone_number"),
                     raw=data,
                 )
+
+            error_data = data.get("error", {})
+            return ConnectionStatus(
+                connected=False,
+                status="disconnected",
+                error=error_data.get("message", f"HTTP {resp.status_code}"),
+                raw=data,
+            )
         except Exception as exc:
             logger.error("meta_status_exception", error=str(exc))
             return ConnectionStatus(connected=False, status="error", error=str(exc))
@@ -161,26 +159,26 @@ class MetaCloudProvider(WhatsAppProviderBase):
         url = f"{GRAPH_BASE_URL}/{self._waba_id}/message_templates"
         params: dict[str, Any] = {"limit": limit}
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.get(url, params=params, headers=self._headers())
-                data = resp.json()
-
-                if resp.status_code != 200:
-                    logger.error("meta_list_templates_failed", status=resp.status_code)
-                    return []
-
-                templates = []
-                for t in data.get("data", []):
-                    templates.append(TemplateInfo(
-                        id=t.get("id"),
-                        name=t.get("name", ""),
-                        status=t.get("status", "UNKNOWN"),
-                        category=t.get("category", ""),
-                        language=t.get("language", "pt_BR"),
-                        components=t.get("components", []),
-                        raw=t,
-                    ))
-                return templates
+            client = get_http_client()
+            resp = await client.get(url, params=params, headers=self._headers())
+            data = resp.json()
+
+            if resp.status_code != 200:
+                logger.error("meta_list_templates_failed", status=resp.status_code)
+                return []
+
+            templates = []
+            for t in data.get("data", []):
+                templates.append(TemplateInfo(
+                    id=t.get("id"),
+                    name=t.get("name", ""),
+                    status=t.get("status", "UNKNOWN"),
+                    category=t.get("category", ""),
+                    language=t.get("language", "pt_BR"),
+                    components=t.get("components", []),
+                    raw=t,
+                ))
+            return templates
         except Exception as exc:
             logger.error("meta_list_templates_exception", error=str(exc))
             return []
@@ -198,25 +196,25 @@ class MetaCloudProvider(WhatsAppProviderBase):
         """
         url = f"{GRAPH_BASE_URL}/{self._waba_id}/message_templates"
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(url, json=template_data, headers=self._headers())
-                data = resp.json()
-
-                if resp.status_code in (200, 201):
-                    logger.info("meta_template_created", name=template_data.get("name"))
-                    return TemplateInfo(
-                        id=data.get("id"),
-                        name=template_data.get("name", ""),
-                        status=data.get("status", "PENDING"),
-                        category=template_data.get("category", ""),
-                        language=template_data.get("language", "pt_BR"),
-                        components=template_data.get("components", []),
-                        raw=data,
-                    )
-
-                error_data = data.get("error", {})
-                error_msg = error_data.get("message", f"HTTP {resp.status_code}")
-                raise ValueError(f"Failed to create template: {error_msg}")
+            client = get_http_client()
+            resp = await client.post(url, json=template_data, headers=self._headers())
+            data = resp.json()
+
+            if resp.status_code in (200, 201):
+                logger.info("meta_template_created", name=template_data.get("name"))
+                return TemplateInfo(
+                    id=data.get("id"),
+                    name=template_data.get("name", ""),
+                    status=data.get("status", "PENDING"),
+                    category=template_data.get("category", ""),
+                    language=template_data.get("language", "pt_BR"),
+                    components=template_data.get("components", []),
+                    raw=data,
+                )
+
+            error_data = data.get("error", {})
+            error_msg = error_data.get("message", f"HTTP {resp.status_code}")
+            raise ValueError(f"Failed to create template: {error_msg}")
         except ValueError:
             raise
         except Exception as exc:
@@ -228,27 +226,27 @@ class MetaCloudProvider(WhatsAppProviderBase):
         url = f"{GRAPH_BASE_URL}/{self._waba_id}/message_templates"
         params = {"name": template_name}
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.get(url, params=params, headers=self._headers())
-                data = resp.json()
-
-                if resp.status_code != 200:
-                    return None
-
-                templates = data.get("data", [])
-                if not templates:
-                    return None
-
-                t = templates[0]
-                return TemplateInfo(
-                    id=t.get("id"),
-                    name=t.get("name", ""),
-                    status=t.get("status", "UNKNOWN"),
-                    category=t.get("category", ""),
-                    language=t.get("language", "pt_BR"),
-                    components=t.get("components", []),
-                    raw=t,
-                )
+            client = get_http_client()
+            resp = await client.get(url, params=params, headers=self._headers())
+            data = resp.json()
+
+            if resp.status_code != 200:
+                return None
+
+            templates = data.get("data", [])
+            if not templates:
+                return None
+
+            t = templates[0]
+            return TemplateInfo(
+                id=t.get("id"),
+                name=t.get("name", ""),
+                status=t.get("status", "UNKNOWN"),
+                category=t.get("category", ""),
+                language=t.get("language", "pt_BR"),
+                components=t.get("components", []),
+                raw=t,
+            )
         except Exception as exc:
             logger.error("meta_get_template_exception", name=template_name, error=str(exc))
             return None
@@ -258,16 +256,16 @@ class MetaCloudProvider(WhatsAppProviderBase):
         url = f"{GRAPH_BASE_URL}/{self._waba_id}/message_templates"
         params = {"name": template_name}
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.delete(url, params=params, headers=self._headers())
-                if resp.status_code == 200:
-                    logger.info("meta_template_deleted", name=template_name)
-                    return True
-
-                data = resp.json()
-                error_msg = data.get("error", {}).get("message", f"HTTP {resp.status_code}")
-                logger.error("meta_delete_template_failed", name=template_name, error=error_msg)
-                return False
+            client = get_http_client()
+            resp = await client.delete(url, params=params, headers=self._headers())
+            if resp.status_code == 200:
+                logger.info("meta_template_deleted", name=template_name)
+                return True
+
+            data = resp.json()
+            error_msg = data.get("error", {}).get("message", f"HTTP {resp.status_code}")
+            logger.error("meta_delete_template_failed", name=template_name, error=error_msg)
+            return False
         except Exception as exc:
             logger.error("meta_delete_template_exception", name=template_name, error=str(exc))
             return False
@@ -11,16 +11,13 @@ Auth: header 'token' with the instance token.
 
 from typing import Any, Optional
 
-import httpx
-
 from app.services.whatsapp.base import WhatsAppProviderBase
 from app.services.whatsapp.schemas import ConnectionStatus, SendResult
+from app.utils.http import get_http_client
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-DEFAULT_TIMEOUT = 30.0
-
 
 class UazapiProvider(WhatsAppProviderBase):
     """Adapter for UAZAPI WhatsApp API v2.0."""
@@ -41,31 +38,31 @@ class UazapiProvider(WhatsAppProviderBase):
             "text": body,
         }
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(
-                    f"{self._base_url}/send/text",
-                    json=payload,
-                    headers=self._headers(),
-                )
-                data = resp.json() if resp.status_code == 200 else {}
-
-                if resp.status_code == 200:
-                    logger.info("uazapi_text_sent", to=to)
-                    return SendResult(
-                        success=True,
-                        message_id=data.get("id") or data.get("messageid"),
-                        provider=self.provider_name,
-                        raw_response=data,
-                    )
-
-                error_msg = data.get("error", f"HTTP {resp.status_code}")
-                logger.error("uazapi_send_failed", to=to, status=resp.status_code, error=error_msg)
+            client = get_http_client()
+            resp = await client.post(
+                f"{self._base_url}/send/text",
+                json=payload,
+                headers=self._headers(),
+            )
+            data = resp.json() if resp.status_code == 200 else {}
+
+            if resp.status_code == 200:
+                logger.info("uazapi_text_sent", to=to)
                 return SendResult(
-                    success=False,
+                    success=True,
+                    message_id=data.get("id") or data.get("messageid"),
                     provider=self.provider_name,
-                    error=error_msg,
                     raw_response=data,
                 )
+
+            error_msg = data.get("error", f"HTTP {resp.status_code}")
+            logger.error("uazapi_send_failed", to=to, status=resp.status_code, error=error_msg)
+            return SendResult(
+                success=False,
+                provider=self.provider_name,
+                error=error_msg,
+                raw_response=data,
+            )
         except Exception as exc:
             logger.error("uazapi_send_exception", to=to, error=str(exc))
             return SendResult(success=False, provider=self.provider_name, error=str(exc))
@@ -91,30 +88,30 @@ class UazapiProvider(WhatsAppProviderBase):
     async def check_connection(self) -> ConnectionStatus:
         """Check UAZAPI instance status via GET /instance/status."""
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.get(
-                    f"{self._base_url}/instance/status",
-                    headers=self._headers(),
-                )
-                if resp.status_code != 200:
-                    return ConnectionStatus(
-                        connected=False,
-                        status="error",
-                        error=f"HTTP {resp.status_code}",
-                    )
-
-                data = resp.json()
-                instance = data.get("instance", {})
-                status_info = data.get("status", {})
-                connected = status_info.get("connected", False)
-
+            client = get_http_client()
+            resp = await client.get(
+                f"{self._base_url}/instance/status",
+                headers=self._headers(),
+            )
+            if resp.status_code != 200:
                 return ConnectionStatus(
-                    connected=connected,
-                    status=instance.get("status", "unknown"),
-                    profile_name=instance.get("profileName"),
-                    phone_number=status_info.get("jid", {}).get("user") if isinstance(status_info.get("jid"), dict) else None,
-                    raw=data,
+                    connected=False,
+                    status="error",
+                    error=f"HTTP {resp.status_code}",
                 )
+
+            data = resp.json()
+            instance = data.get("instance", {})
+            status_info = data.get("status", {})
+            connected = status_info.get("connected", False)
+
+            return ConnectionStatus(
+                connected=connected,
+                status=instance.get("status", "unknown"),
+                profile_name=instance.get("profileName"),
+                phone_number=status_info.get("jid", {}).get("user") if isinstance(status_info.get("jid"), dict) else None,
+                raw=data,
+            )
         except Exception as exc:
             logger.error("uazapi_status_exception", error=str(exc))
             return ConnectionStatus(connected=False, status="error", error=str(exc))
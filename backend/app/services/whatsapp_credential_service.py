@@ -79,7 +79,7 @@ async def get_provider(
         # Prefer the default provider
         query = query.order_by(WhatsAppCredential.is_default.desc())
 
-    result = await db.execute(query)
+    result = await db.execute(query.limit(1))
     cred = result.scalars().first()
 
     if not cred:
@@ -26,16 +26,15 @@ logger = get_logger(__name__)
 
 async def _get_default_provider_type(db: AsyncSession, company_id: UUID) -> Optional[WhatsAppProviderType]:
     """Return the provider type of the default (or only active) credential, or None."""
-    result = await db.execute(
-        select(WhatsAppCredential).where(
+    provider = (await db.execute(
+        select(WhatsAppCredential.provider).where(
             WhatsAppCredential.company_id == company_id,
             WhatsAppCredential.is_active == True,
-        ).order_by(WhatsAppCredential.is_default.desc())
-    )
-    cred = result.scalars().first()
-    if cred is None:
+        ).order_by(WhatsAppCredential.is_default.desc()).limit(1)
+    )).scalar_one_or_none()
+    if provider is None:
         return None
-    return WhatsAppProviderType(cred.provider) if isinstance(cred.provider, str) else cred.provider
+    return WhatsAppProviderType(provider) if isinstance(provider, str) else provider
 
 
 async def send_whatsapp_message(
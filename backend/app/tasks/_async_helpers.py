@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.utils.http import close_http_client
 
 T = TypeVar("T")
 
@@ -67,6 +68,10 @@ def run_in_task_loop(coro_factory: Callable[[TaskSessionFactory], Awaitable[T]])
     try:
         return loop.run_until_complete(coro_factory(session_factory))
     finally:
+        try:
+            loop.run_until_complete(close_http_client())
+        except Exception:
+            pass
         try:
             loop.run_until_complete(engine.dispose())
         except Exception:
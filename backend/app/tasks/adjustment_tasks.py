@@ -97,7 +97,7 @@ async def _apply_annual_adjustments_async(session_factory: TaskSessionFactory):
 
             # A per-contract manual index value (e.g. IPCA do dia) overrides the lookup.
             if cl.manual_index_value is not None:
-                index_pct = Decimal(str(cl.manual_index_value))
+                index_pct = cl.manual_index_value
             else:
                 cache_key = (index_type, cl.company_id)
                 if cache_key not in index_cache:
@@ -268,6 +268,8 @@ async def _process_batch_creation_async(
         informativos = ((input_data.get("informativos") or []) + fee_lines)[:5]
 
         results = []
+        # One issue date for the whole batch, even if it runs past midnight.
+        issued_on = date.today()
 
         for i in range(num_installments):
             due_date = first_due + relativedelta(months=interval * i)
@@ -321,7 +323,7 @@ async def _process_batch_creation_async(
                         "especie_documento", "DUPLICATA_MERCANTIL_INDICACAO"
                     ),
                     data_vencimento=due_date,
-                    data_emissao=date.today(),
+                    data_emissao=issued_on,
                     valor=valor,
                     status=BoletoStatus.NORMAL,
                     txid=api_result.txid,
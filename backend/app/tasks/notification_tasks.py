@@ -469,7 +469,7 @@ def overdue_escalation(self):
 
 async def _notify_cycle_completion_async(session_factory: TaskSessionFactory):
     """Create CycleApproval records when a 12-installment cycle completes."""
-    from sqlalchemy import select, func
+    from sqlalchemy import exists, select, func
     from app.models.boleto import Boleto
     from app.models.client_lot import ClientLot
     from app.models.cycle_approval import CycleApproval
@@ -492,15 +492,20 @@ async def _notify_cycle_completion_async(session_factory: TaskSessionFactory):
 
             # Count installments in the cycle settled via a LIQUIDADO boleto.
             # Renewal does not recognize payments made by other means.
+            # EXISTS is a semi-join, so an invoice with several LIQUIDADO
+            # boletos is counted once without a COUNT(DISTINCT ...) sort.
             paid_q = await db.execute(
-                select(func.count(func.distinct(Invoice.id)))
-                .join(Boleto, Boleto.invoice_id == Invoice.id)
+                select(func.count())
+                .select_from(Invoice)
                 .where(
                     Invoice.client_lot_id == cl.id,
                     Invoice.installment_number >= cycle_start,
                     Invoice.installment_number <= cycle_end,
                     Invoice.status == InvoiceStatus.PAID,
-                    Boleto.status == BoletoStatus.LIQUIDADO,
+                    exists().where(
+                        Boleto.invoice_id == Invoice.id,
+                        Boleto.status == BoletoStatus.LIQUIDADO,
+                    ),
                 )
             )
             paid_count = paid_q.scalar() or 0
@@ -31,6 +31,9 @@ _SITUACAO_MAP = {
     "NORMAL": "NORMAL",
 }
 
+# Situações that mean the boleto was written off at Sicredi.
+_BAIXA_SITUACOES = frozenset(("BAIXADO", "BAIXADO POR SOLICITACAO"))
+
 # Max boletos reconciled per company per run, to bound Sicredi API usage.
 _MAX_PER_COMPANY = 200
 
@@ -103,7 +106,7 @@ async def sync_company_open_boletos(db, sicredi_client, company_id, *, delay: fl
             await mark_boleto_liquidado(db, boleto, source="sync_open_boletos")
         else:
             boleto.status = new_status
-            if situacao in ("BAIXADO", "BAIXADO POR SOLICITACAO"):
+            if situacao in _BAIXA_SITUACOES:
                 if boleto.writeoff_type != WriteoffType.MANUAL_ADMIN:
                     boleto.writeoff_type = WriteoffType.BAIXA_EXTERNA
                     boleto.writeoff_reason = (
@@ -0,0 +1,80 @@
+"""Small in-process caches for hot-path lookups."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Process-local: every uvicorn/celery worker keeps its own copy, so only
+    cache values that are safe to be briefly stale.  Operations are guarded by
+    a lock because sync dependencies run on FastAPI's threadpool.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or *default* if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value*; *ttl* overrides the default expiry for this entry."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value (expired or not)."""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def pop_after_commit(session: AsyncSession, cache: TTLCache, key: Hashable) -> None:
+    """Evict *key* from *cache* once *session*'s transaction commits.
+
+    Evicting before the commit leaves a window in which a concurrent read can
+    re-cache the pre-commit rows for the full TTL.  Nothing is evicted if the
+    transaction rolls back, since the cached value is then still current.
+    """
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        lambda _session: cache.pop(key),
+        once=True,
+    )
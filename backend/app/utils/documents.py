@@ -1,56 +1,121 @@
 """CPF/CNPJ validation helpers (Brazilian taxpayer documents)."""
 
-import re
+from functools import lru_cache
+
+
+class _AsciiKeepTable(dict):
+    """str.translate table that keeps the given ASCII characters.
+
+    Everything else is deleted.  Filled lazily for Latin-1 code points, which
+    covers the punctuation of formatted documents; anything beyond is deleted
+    without being stored so arbitrary input cannot grow the table.
+    """
+
+    def __init__(self, keep: str):
+        super().__init__()
+        self._keep = frozenset(map(ord, keep))
+
+    def __missing__(self, codepoint: int):
+        value = codepoint if codepoint in self._keep else None
+        if codepoint < 256:
+            self[codepoint] = value
+        return value
+
+
+_KEEP_DIGITS = _AsciiKeepTable("0123456789")
+_KEEP_CNPJ_CHARS = _AsciiKeepTable("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
 
 def _only_digits(value: str) -> str:
-    return re.sub(r"\D", "", value or "")
+    return (value or "").translate(_KEEP_DIGITS)
+
+
+def _cnpj_chars(value: str) -> str:
+    """Upper-cased digits and letters, for alphanumeric CNPJs."""
+    return (value or "").upper().translate(_KEEP_CNPJ_CHARS)
 
 
 def normalize_cpf_cnpj(value: str) -> str:
-    """Canonical storage/compare form for a CPF/CNPJ: digits only.
+    """Canonical storage/compare form for a CPF/CNPJ.
 
     Ensures "123.456.789-00" and "12345678900" are treated as the same
-    document, closing the duplicate-registration gap.
+    document, closing the duplicate-registration gap.  Values are reduced to
+    digits, except alphanumeric CNPJs, which keep their letters upper-cased
+    ("12.abc.345/01de-35" -> "12ABC34501DE35") so they are not mangled into
+    a shorter number.
     """
-    return _only_digits(value)
+    digits = _only_digits(value)
+    chars = _cnpj_chars(value)
+    alphanumeric = len(chars) == 14 and not chars.isdigit() and chars[12:].isdigit()
+    # A stray label around a numeric document ("CPF 529.982.247-25") still
+    # reduces to its digits unless the letters form a valid CNPJ.
+    if alphanumeric and (len(digits) not in (11, 14) or _cnpj_digits_valid(chars)):
+        return chars
+    return digits
 
 
-def is_valid_cpf(cpf: str) -> bool:
-    """Validate a CPF using its two check digits."""
-    cpf = _only_digits(cpf)
+# Check-digit weights, built once instead of per call.
+_CPF_WEIGHTS = ((10, 9, 8, 7, 6, 5, 4, 3, 2), (11, 10, 9, 8, 7, 6, 5, 4, 3, 2))
+_CNPJ_WEIGHTS = (
+    (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+)
+
+
+@lru_cache(maxsize=8192)
+def _cpf_digits_valid(cpf: str) -> bool:
+    """Check-digit test for an already-cleaned CPF.
+
+    Memoized: batch imports and sync jobs re-validate the same documents.
+    """
     if len(cpf) != 11 or cpf == cpf[0] * 11:
         return False
-    for length in (9, 10):
-        total = sum(int(cpf[i]) * ((length + 1) - i) for i in range(length))
-        check = (total * 10) % 11
+    digits = tuple(map(int, cpf))
+    for weights in _CPF_WEIGHTS:
+        pos = len(weights)
+        check = (sum(d * w for d, w in zip(digits, weights)) * 10) % 11
         check = 0 if check == 10 else check
-        if check != int(cpf[length]):
+        if check != digits[pos]:
             return False
     return True
 
 
-def is_valid_cnpj(cnpj: str) -> bool:
-    """Validate a CNPJ using its two check digits."""
-    cnpj = _only_digits(cnpj)
-    if len(cnpj) != 14 or cnpj == cnpj[0] * 14:
+@lru_cache(maxsize=8192)
+def _cnpj_digits_valid(cnpj: str) -> bool:
+    """Check-digit test for an already-cleaned CNPJ (memoized).
+
+    Accepts the alphanumeric CNPJ issued since July 2026: the first 12
+    positions may be A-Z and each character weighs ``ord(c) - 48``, so
+    digits keep their value and numeric CNPJs validate as before.  The two
+    check digits are always numeric.
+    """
+    if len(cnpj) != 14 or not cnpj[12:].isdigit() or cnpj == cnpj[0] * 14:
         return False
-    weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    weights_second = [6] + weights_first
-    for weights, pos in ((weights_first, 12), (weights_second, 13)):
-        total = sum(int(cnpj[i]) * weights[i] for i in range(pos))
-        rem = total % 11
+    digits = tuple(ord(c) - 48 for c in cnpj)
+    for weights in _CNPJ_WEIGHTS:
+        pos = len(weights)
+        rem = sum(d * w for d, w in zip(digits, weights)) % 11
         check = 0 if rem < 2 else 11 - rem
-        if check != int(cnpj[pos]):
+        if check != digits[pos]:
             return False
     return True
 
 
+def is_valid_cpf(cpf: str) -> bool:
+    """Validate a CPF using its two check digits."""
+    return _cpf_digits_valid(_only_digits(cpf))
+
+
+def is_valid_cnpj(cnpj: str) -> bool:
+    """Validate a numeric or alphanumeric CNPJ using its two check digits."""
+    return _cnpj_digits_valid(_only_digits(cnpj)) or _cnpj_digits_valid(_cnpj_chars(cnpj))
+
+
 def is_valid_cpf_cnpj(documento: str) -> bool:
-    """Validate a document as either a CPF (11 digits) or CNPJ (14 digits)."""
+    """Validate a document as a CPF (11 digits) or a numeric/alphanumeric CNPJ."""
     digits = _only_digits(documento)
-    if len(digits) == 11:
-        return is_valid_cpf(digits)
-    if len(digits) == 14:
-        return is_valid_cnpj(digits)
-    return False
+    if len(digits) == 11 and _cpf_digits_valid(digits):
+        return True
+    if len(digits) == 14 and _cnpj_digits_valid(digits):
+        return True
+    return _cnpj_digits_valid(_cnpj_chars(documento))
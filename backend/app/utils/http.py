@@ -0,0 +1,45 @@
+"""Shared outbound HTTP client for third-party APIs (WhatsApp, Sicredi)."""
+
+import asyncio
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+# An httpx.AsyncClient's connection pool belongs to the event loop that
+# opened it, and Celery tasks each run on a fresh loop (see
+# tasks/_async_helpers), so one client is kept per running loop.  Within a
+# loop every outbound call reuses pooled keep-alive connections instead of
+# paying a new TCP + TLS handshake per request.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled AsyncClient for the running event loop.
+
+    Callers pass per-request ``headers`` / ``timeout``; the client itself
+    carries no credentials and refuses to store cookies, so nothing set by
+    one tenant's API call is replayed on another's.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's client (app shutdown / end of a task loop)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,12 +1,50 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import structlog
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer.
+
+    JSONRenderer passes its ``default`` fallback (repr for unknown types);
+    the formatter expects ``str``, hence the decode.
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched.
+
+    The stock prepare() formats the record (traceback included) in the
+    calling thread and flattens ``msg``, which would both keep that work on
+    the event loop and break structlog's ProcessorFormatter downstream.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logging(debug: bool = False) -> None:
     """Configure structlog with JSON output for production and pretty output for dev."""
     log_level = logging.DEBUG if debug else logging.INFO
@@ -24,7 +62,7 @@ def setup_logging(debug: bool = False) -> None:
     if debug:
         renderer: structlog.types.Processor = structlog.dev.ConsoleRenderer()
     else:
-        renderer = structlog.processors.JSONRenderer()
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
 
     structlog.configure(
         processors=[
@@ -46,9 +84,17 @@ def setup_logging(debug: bool = False) -> None:
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
+    # Request code only enqueues; rendering (JSON, tracebacks) and the stdout
+    # write happen on the listener thread, off the event loop.
+    global _listener
+    shutdown_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
     root_logger.setLevel(log_level)
 
     # Quiet noisy libraries
@@ -58,6 +104,9 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
     """Return a bound structlog logger."""
     return structlog.get_logger(name)
@@ -0,0 +1,14 @@
+-- 020: trigram indexes for the client list search (ILIKE '%term%').
+-- Mirrors alembic revision 017_clients_search_trgm.
+-- A leading wildcard cannot use a B-tree; gin_trgm_ops makes it index-backed.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_clients_full_name_trgm
+    ON clients USING gin (full_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_clients_cpf_cnpj_trgm
+    ON clients USING gin (cpf_cnpj gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_clients_email_trgm
+    ON clients USING gin (email gin_trgm_ops);
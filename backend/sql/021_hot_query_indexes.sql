@@ -0,0 +1,23 @@
+-- 021: composite / partial indexes for hot listing and dashboard queries.
+-- Mirrors alembic revision 018_hot_query_indexes.
+
+-- Per-contract invoice lookups (client_lot_id had no index).
+CREATE INDEX IF NOT EXISTS ix_invoices_client_lot_due
+    ON invoices (client_lot_id, due_date);
+
+-- Dashboard / financial aggregates only read these statuses.
+CREATE INDEX IF NOT EXISTS ix_invoices_company_overdue
+    ON invoices (company_id, due_date) WHERE status = 'OVERDUE';
+
+CREATE INDEX IF NOT EXISTS ix_invoices_company_pending
+    ON invoices (company_id, due_date) WHERE status = 'PENDING';
+
+-- Paginated lists: tenant filter + ORDER BY created_at DESC.
+CREATE INDEX IF NOT EXISTS ix_clients_company_created
+    ON clients (company_id, created_at);
+
+CREATE INDEX IF NOT EXISTS ix_lots_company_created
+    ON lots (company_id, created_at);
+
+CREATE INDEX IF NOT EXISTS ix_service_orders_company_created
+    ON service_orders (company_id, created_at);
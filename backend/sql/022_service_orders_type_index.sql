@@ -0,0 +1,5 @@
+-- 022: index the service_orders -> service_types FK used by the analytics join.
+-- Mirrors alembic revision 019_service_orders_type_index.
+
+CREATE INDEX IF NOT EXISTS ix_service_orders_service_type_id
+    ON service_orders (service_type_id);
@@ -0,0 +1,5 @@
+-- 023: partial index for the open invoices of a contract (client portal summary).
+-- Mirrors alembic revision 020_invoices_open_by_contract_index.
+
+CREATE INDEX IF NOT EXISTS ix_invoices_client_lot_open_due
+    ON invoices (client_lot_id, due_date) WHERE status IN ('PENDING', 'OVERDUE');
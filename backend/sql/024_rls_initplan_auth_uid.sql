@@ -0,0 +1,43 @@
+-- 024: evaluate auth.uid() once per statement in every public RLS policy.
+-- RLS only (no alembic revision): policies are managed from sql/.
+--
+-- A bare auth.uid() in a policy is re-evaluated for each row the policy
+-- checks (e.g. clients_own_data: profile_id = auth.uid()).  Wrapped as
+-- (SELECT auth.uid()) the planner hoists it into an InitPlan and compares
+-- every row against one constant.  The policies in 001..016 are rewritten in
+-- place from pg_policies, so their logic is unchanged and policies added
+-- later by those scripts are covered too.  Safe to re-run: already wrapped
+-- calls (deparsed as "( SELECT auth.uid() AS uid)") are left alone.
+
+DO $$
+DECLARE
+  pol record;
+  wrapped CONSTANT text := '( SELECT auth.uid() AS uid)';
+  new_qual text;
+  new_check text;
+BEGIN
+  FOR pol IN
+    SELECT tablename, policyname, qual, with_check
+    FROM pg_policies
+    WHERE schemaname = 'public'
+      AND (qual LIKE '%auth.uid()%' OR with_check LIKE '%auth.uid()%')
+  LOOP
+    new_qual := replace(
+      replace(replace(pol.qual, wrapped, '__UID__'), 'auth.uid()', '(SELECT auth.uid())'),
+      '__UID__', wrapped
+    );
+    new_check := replace(
+      replace(replace(pol.with_check, wrapped, '__UID__'), 'auth.uid()', '(SELECT auth.uid())'),
+      '__UID__', wrapped
+    );
+
+    IF new_qual IS DISTINCT FROM pol.qual THEN
+      EXECUTE format('ALTER POLICY %I ON public.%I USING (%s)',
+                     pol.policyname, pol.tablename, new_qual);
+    END IF;
+    IF new_check IS DISTINCT FROM pol.with_check THEN
+      EXECUTE format('ALTER POLICY %I ON public.%I WITH CHECK (%s)',
+                     pol.policyname, pol.tablename, new_check);
+    END IF;
+  END LOOP;
+END $$;
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
@@ -33,9 +34,9 @@ def event_loop():
     loop.close()
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def setup_db():
-    """Create tables before tests and drop after."""
+@pytest_asyncio.fixture(scope="session")
+async def db_schema():
+    """Create tables once for the session and drop them at the end."""
     async with engine_test.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -43,6 +44,31 @@ async def setup_db():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "no_db: pure unit test that never touches the database")
+
+
+@pytest_asyncio.fixture
+async def clean_tables(db_schema):
+    """Empty every table after the test.
+
+    Endpoints commit, so rolling back the session is not enough; one
+    TRUNCATE is much cheaper than rebuilding the schema per test.
+    """
+    yield
+    async with engine_test.begin() as conn:
+        preparer = conn.dialect.identifier_preparer
+        tables = ", ".join(preparer.format_table(t) for t in Base.metadata.sorted_tables)
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+
+@pytest.fixture(autouse=True)
+def setup_db(request):
+    """Give every test empty tables, except modules marked ``no_db``."""
+    if request.node.get_closest_marker("no_db") is None:
+        request.getfixturevalue("clean_tables")
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide a transactional test database session."""
@@ -0,0 +1,60 @@
+"""Unit tests for the in-process TTLCache (pure, no DB)."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.cache import TTLCache, pop_after_commit
+
+pytestmark = pytest.mark.no_db
+
+
+def test_get_set_and_default():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing", "x") == "x"
+    assert "a" in cache
+
+
+def test_entry_expires_after_ttl():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" becomes the LRU entry
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+
+def test_pop_after_commit_waits_for_commit():
+    async def scenario():
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        async with AsyncSession() as session:
+            pop_after_commit(session, cache, "a")
+            assert "a" in cache
+            await session.rollback()
+            assert "a" in cache
+            await session.commit()
+            assert "a" not in cache
+
+    asyncio.run(scenario())
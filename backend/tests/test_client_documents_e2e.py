@@ -46,6 +46,7 @@ async def test_upload_then_list_client_documents(
         return_value=fake_path,
     ), patch(
         "app.api.v1.admin.clients.get_public_url",
+        new_callable=AsyncMock,
         return_value=signed_url,
     ):
         up = await client.post(
@@ -71,7 +72,12 @@ async def test_upload_then_list_client_documents(
     assert created["reviewed_at"] is not None
 
     # Act 2: list documents like the client's ficha does.
-    with patch("app.api.v1.admin.clients.get_public_url", return_value=signed_url):
+    # The list signs every document in one batched call.
+    with patch(
+        "app.api.v1.admin.clients.get_signed_urls",
+        new_callable=AsyncMock,
+        return_value={fake_path: signed_url},
+    ):
         listed = await client.get(
             f"/api/v1/admin/clients/{c.id}/documents",
             headers=auth_headers(company_admin),
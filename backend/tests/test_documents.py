@@ -0,0 +1,104 @@
+"""Unit tests for CPF/CNPJ validation helpers (pure, no DB)."""
+
+import random
+
+import pytest
+
+from app.utils.documents import (
+    is_valid_cnpj,
+    is_valid_cpf,
+    is_valid_cpf_cnpj,
+    normalize_cpf_cnpj,
+)
+
+pytestmark = pytest.mark.no_db
+
+# Documents are generated from a fixed seed with the check-digit rules written
+# out independently of app.utils.documents, so a wrong weight table there
+# can't also be a wrong expectation here.
+_rng = random.Random(20260701)
+_CNPJ_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _cpf_check(body: str) -> str:
+    total = sum(int(c) * w for c, w in zip(body, range(len(body) + 1, 1, -1)))
+    rem = total * 10 % 11
+    return str(0 if rem == 10 else rem)
+
+
+def _cnpj_check(body: str) -> str:
+    weights = [2, 3, 4, 5, 6, 7, 8, 9] * 2
+    total = sum((ord(c) - 48) * w for c, w in zip(reversed(body), weights))
+    rem = total % 11
+    return str(0 if rem < 2 else 11 - rem)
+
+
+def _make_cpf() -> str:
+    body = "".join(_rng.choice("0123456789") for _ in range(9))
+    body += _cpf_check(body)
+    return body + _cpf_check(body)
+
+
+def _make_cnpj(alphabet: str) -> str:
+    body = "".join(_rng.choice(alphabet) for _ in range(12))
+    body += _cnpj_check(body)
+    return body + _cnpj_check(body)
+
+
+_CPFS = [_make_cpf() for _ in range(50)]
+_CNPJS = [_make_cnpj("0123456789") for _ in range(50)] + [_make_cnpj(_CNPJ_ALPHABET) for _ in range(50)]
+
+
+def test_valid_cpf_formatted_and_bare():
+    assert is_valid_cpf("529.982.247-25")
+    assert is_valid_cpf("52998224725")
+    assert is_valid_cpf_cnpj("529.982.247-25")
+
+
+def test_invalid_cpf():
+    assert not is_valid_cpf("529.982.247-24")
+    assert not is_valid_cpf("111.111.111-11")
+    assert not is_valid_cpf("")
+
+
+def test_valid_numeric_cnpj():
+    assert is_valid_cnpj("11.222.333/0001-81")
+    assert is_valid_cpf_cnpj("11222333000181")
+
+
+def test_alphanumeric_cnpj():
+    """Letters in the first 12 positions count as ord(c) - 48."""
+    assert is_valid_cnpj("12.ABC.345/01DE-35")
+    assert is_valid_cnpj("12abc34501de35")
+    assert is_valid_cpf_cnpj("12.ABC.345/01DE-35")
+    assert not is_valid_cpf_cnpj("12.ABC.345/01DE-36")
+
+
+def test_alphanumeric_check_digits_must_be_numeric():
+    assert not is_valid_cnpj("12ABC34501DEAB")
+
+
+def test_normalize_keeps_alphanumeric_cnpj():
+    assert normalize_cpf_cnpj("12.abc.345/01de-35") == "12ABC34501DE35"
+    assert normalize_cpf_cnpj("11.222.333/0001-81") == "11222333000181"
+    # A label around a numeric document still reduces to its digits.
+    assert normalize_cpf_cnpj("CPF 529.982.247-25") == "52998224725"
+
+
+@pytest.mark.parametrize("cpf", _CPFS)
+def test_generated_cpfs(cpf: str):
+    repeated = cpf == cpf[0] * 11
+    assert is_valid_cpf(cpf) is not repeated
+    assert is_valid_cpf(f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}") is not repeated
+    # Any single changed check digit must be caught.
+    wrong = cpf[:10] + str((int(cpf[10]) + 1) % 10)
+    assert not is_valid_cpf(wrong)
+
+
+@pytest.mark.parametrize("cnpj", _CNPJS)
+def test_generated_cnpjs(cnpj: str):
+    assert is_valid_cnpj(cnpj)
+    assert is_valid_cpf_cnpj(f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}")
+    assert is_valid_cnpj(cnpj.lower())
+    wrong = cnpj[:13] + str((int(cnpj[13]) + 1) % 10)
+    assert not is_valid_cnpj(wrong)
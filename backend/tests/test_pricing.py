@@ -6,6 +6,8 @@ import pytest
 
 from app.services.pricing_service import compute_plan
 
+pytestmark = pytest.mark.no_db
+
 
 def test_installments_given_derives_monthly():
     plan = compute_plan(total_value=200000, down_payment=50000, installments=180)
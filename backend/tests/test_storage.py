@@ -1,10 +1,16 @@
 """Tests for storage service validations."""
 
+import asyncio
+import io
+
 import pytest
+from starlette.datastructures import UploadFile
 
-from app.services.storage_service import validate_file
+from app.services.storage_service import read_upload, validate_file
 from app.utils.exceptions import StorageError
 
+pytestmark = pytest.mark.no_db
+
 
 def test_valid_pdf():
     """PDF files should pass validation."""
@@ -42,3 +48,18 @@ def test_invalid_svg():
     """SVG is not in the allowed list."""
     with pytest.raises(StorageError, match="not allowed"):
         validate_file("image.svg", 100)
+
+
+def test_read_upload_within_limit():
+    """Uploads under the limit are returned whole, with or without a size."""
+    for size in (None, 3000):
+        upload = UploadFile(io.BytesIO(b"x" * 3000), size=size)
+        assert asyncio.run(read_upload(upload, max_size=5000)) == b"x" * 3000
+
+
+def test_read_upload_too_large():
+    """Oversized uploads are refused whether or not the size was declared."""
+    for size in (None, 6000):
+        upload = UploadFile(io.BytesIO(b"x" * 6000), size=size)
+        with pytest.raises(StorageError, match="maximum size"):
+            asyncio.run(read_upload(upload, max_size=5000))